@@ -6,13 +6,50 @@ Commands are provided via argv[1] and payload as JSON on stdin.
 Outputs JSON responses for Node clients.
 """
 
+import atexit
+import contextlib
 import json
 import os
 import sqlite3
 import sys
 import time
 import hashlib
-from contextlib import closing
+
+ALLOCATOR_LIBRARIES = (
+    '/usr/lib/x86_64-linux-gnu/libmimalloc.so.2',
+    '/usr/lib/aarch64-linux-gnu/libmimalloc.so.2',
+    '/usr/lib/x86_64-linux-gnu/libjemalloc.so.2',
+    '/usr/lib/aarch64-linux-gnu/libjemalloc.so.2',
+)
+ALLOCATOR_GUARD = 'MEMINDEX_ALLOCATOR'
+
+
+def preload_allocator():
+    """Re-exec once under mimalloc/jemalloc when either is installed.
+
+    Runs before stdin is read, so the payload is still there for the new
+    process. Setting MEMINDEX_ALLOCATOR (to anything) disables it.
+    """
+    if not sys.platform.startswith('linux') or os.environ.get(ALLOCATOR_GUARD):
+        return
+    preload = os.environ.get('LD_PRELOAD', '')
+    if 'mimalloc' in preload or 'jemalloc' in preload:
+        return
+    for library in ALLOCATOR_LIBRARIES:
+        if os.path.exists(library):
+            env = dict(os.environ)
+            env['LD_PRELOAD'] = f'{library} {preload}'.strip()
+            env[ALLOCATOR_GUARD] = library
+            os.execve(sys.executable, [sys.executable, *sys.argv], env)
+
+
+if __name__ == '__main__':
+    preload_allocator()
+
+# BLAS reads these once at import time; let GEMV use every core unless the
+# caller pinned a thread count.
+for _thread_var in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+    os.environ.setdefault(_thread_var, str(os.cpu_count() or 1))
 
 try:
     import numpy as np
@@ -23,15 +60,49 @@ except ImportError as exc:  # pragma: no cover - dependency hint
     }))
     sys.exit(1)
 
-try:  # pragma: no cover - optional heavy dependency
-    from sentence_transformers import SentenceTransformer
+try:  # pragma: no cover - optional SQLite vector extension
+    import sqlite_vec
+except ImportError:
+    sqlite_vec = None
+
+try:  # pragma: no cover - optional fast JSON codec
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # pragma: no cover - optional fast content hash
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:  # pragma: no cover - optional ANN backend
+    import hnswlib
 except ImportError:
-    SentenceTransformer = None
+    hnswlib = None
 
 MODEL_CACHE = {}
+KERNEL_CACHE = {}
+CONN_CACHE = {}
+EMBED_BACKENDS = ('torch', 'onnx')
+ONNX_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'memindex')
+ONNX_OPSET = 17
 INDEX_CACHE = {}
 DEFAULT_BATCH_SIZE = 8
 MAX_BATCH_SIZE = 128
+FLOAT32_BYTES = np.dtype(np.float32).itemsize
+VECTORS_FILENAME = 'vectors.f32'
+INT8_VECTORS_FILENAME = 'vectors.i8'
+INT8_SCALES_FILENAME = 'scales.f32'
+QUANTIZATIONS = ('float32', 'int8')
+QUANTIZED_BLOCK_ROWS = 4096
+HNSW_FILENAME = 'hnsw.bin'
+HNSW_MIN_DOCUMENTS = 1024
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+HNSW_EF_SEARCH = 64
+VEC_TABLE = 'vec_documents'
+NUMBA_MIN_WORK = 1_000_000
+NUMBA_CHUNKS = 64
 
 
 def validate_batch_size(batch_value, default=DEFAULT_BATCH_SIZE):
@@ -66,9 +137,11 @@ def validate_batch_size(batch_value, default=DEFAULT_BATCH_SIZE):
 
 
 def load_payload():
-    raw = sys.stdin.read() or '{}'
+    # Parse the raw bytes directly: no intermediate str decode and copy of
+    # what can be a multi-megabyte upsert payload.
+    raw = sys.stdin.buffer.read() or b'{}'
     try:
-        return json.loads(raw)
+        return json_loads(raw)
     except json.JSONDecodeError as exc:
         raise SystemExit(json.dumps({
             "status": "error",
@@ -76,6 +149,33 @@ def load_payload():
         }))
 
 
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value)
+
+
+def write_response(value):
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(value) + b'\n')
+        sys.stdout.buffer.flush()
+        return
+    print(json.dumps(value))
+
+
+def decode_metadata(metadata_json):
+    try:
+        return json_loads(metadata_json) if metadata_json else {}
+    except json.JSONDecodeError:
+        return {"raw": metadata_json}
+
+
 def ensure_dir(path: str):
     if not os.path.exists(path):
         os.makedirs(path, exist_ok=True)
@@ -86,24 +186,76 @@ def get_db_path(index_path: str) -> str:
     return os.path.join(index_path, 'index.sqlite3')
 
 
-def with_connection(db_path: str):
-    conn = sqlite3.connect(db_path)
+class IndexConnection(sqlite3.Connection):
+    """SQLite connection that records per-connection setup state."""
+
+    vec_enabled = False
+    schema_ready = False
+
+
+def load_vec_extension(conn: sqlite3.Connection) -> bool:
+    if sqlite_vec is None:
+        return False
+    try:
+        conn.enable_load_extension(True)
+        sqlite_vec.load(conn)
+        conn.enable_load_extension(False)
+    except (AttributeError, sqlite3.Error):
+        # Python builds without extension loading fall back to NumPy search.
+        return False
+    return True
+
+
+def open_connection(db_path: str):
+    # Hot statements are fixed SQL strings, so sqlite3's per-connection
+    # statement cache keeps them prepared for the life of the process.
+    conn = sqlite3.connect(db_path, factory=IndexConnection, cached_statements=256)
     conn.execute('PRAGMA journal_mode=WAL;')
     conn.execute('PRAGMA synchronous=NORMAL;')
     conn.execute('PRAGMA temp_store=MEMORY;')
+    conn.execute('PRAGMA mmap_size=268435456;')
+    conn.execute('PRAGMA cache_size=-65536;')
+    conn.vec_enabled = load_vec_extension(conn)
     return conn
 
 
+def with_connection(db_path: str):
+    """Return the process-wide connection for ``db_path``, opening it once.
+
+    Use it as ``with with_connection(path) as conn:`` so each command commits
+    on success and rolls back on error; the connection itself stays open.
+    """
+    conn = CONN_CACHE.get(db_path)
+    if conn is None:
+        conn = CONN_CACHE[db_path] = open_connection(db_path)
+    return conn
+
+
+@atexit.register
+def close_connections():
+    while CONN_CACHE:
+        _, conn = CONN_CACHE.popitem()
+        conn.close()
+
+
 def ensure_schema(conn: sqlite3.Connection):
+    if conn.schema_ready:
+        return
     conn.execute(
         '''CREATE TABLE IF NOT EXISTS documents (
                id TEXT PRIMARY KEY,
                content_hash TEXT NOT NULL,
                metadata TEXT,
                vector BLOB NOT NULL,
-               updated_at REAL NOT NULL
+               updated_at REAL NOT NULL,
+               slot INTEGER
            )'''
     )
+    columns = {row[1] for row in conn.execute('PRAGMA table_info(documents)')}
+    if 'slot' not in columns:
+        # Indexes created before the vectors sidecar existed get their slots
+        # assigned on the next load_index_cache rebuild.
+        conn.execute('ALTER TABLE documents ADD COLUMN slot INTEGER')
     conn.execute(
         '''CREATE TABLE IF NOT EXISTS meta (
                key TEXT PRIMARY KEY,
@@ -111,16 +263,204 @@ def ensure_schema(conn: sqlite3.Connection):
            )'''
     )
     conn.commit()
+    conn.schema_ready = True
 
 
-def get_model(model_name: str):
-    if SentenceTransformer is None:
+def load_sentence_transformer_class():
+    # Imported lazily: pulling in torch dominates startup, and status/stats
+    # commands (or the ONNX backend once exported) never need it.
+    try:  # pragma: no cover - optional heavy dependency
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
         raise RuntimeError(
             'sentence-transformers missing. Install with: pip install "sentence-transformers<3"'
         )
-    if model_name not in MODEL_CACHE:
-        MODEL_CACHE[model_name] = SentenceTransformer(model_name)
-    return MODEL_CACHE[model_name]
+    return SentenceTransformer
+
+
+def export_onnx_model(model_name: str, export_dir: str):
+    """Export the transformer behind a SentenceTransformer to ONNX once."""
+    import torch
+
+    st_model = load_sentence_transformer_class()(model_name, device='cpu')
+    # Only the transformer is exported; encode() redoes pooling and normalization
+    # itself, so any other module (e.g. a Dense projection) would be dropped.
+    modules = [type(module).__name__ for module in st_model]
+    if modules not in (['Transformer', 'Pooling'], ['Transformer', 'Pooling', 'Normalize']):
+        raise RuntimeError(f'ONNX backend supports Transformer, Pooling[, Normalize] models only ({model_name}: {modules})')
+    transformer, pooling = st_model[0], st_model[1]
+    pooling_mode = pooling.get_pooling_mode_str()
+    if pooling_mode not in ('cls', 'mean'):
+        raise RuntimeError(f'ONNX backend supports CLS or mean pooling only ({model_name}: {pooling_mode})')
+
+    tokenizer = transformer.tokenizer
+    sample = tokenizer(['warmup'], return_tensors='pt')
+    input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids') if name in sample]
+    dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in input_names + ['last_hidden_state']}
+
+    ensure_dir(export_dir)
+    temp_path = os.path.join(export_dir, 'model.onnx.tmp')
+    with torch.no_grad():
+        torch.onnx.export(
+            transformer.auto_model.eval(),
+            tuple(sample[name] for name in input_names),
+            temp_path,
+            input_names=input_names,
+            output_names=['last_hidden_state'],
+            dynamic_axes=dynamic_axes,
+            opset_version=ONNX_OPSET,
+        )
+    tokenizer.save_pretrained(export_dir)
+    with open(os.path.join(export_dir, 'pooling.json'), 'w') as handle:
+        json.dump({
+            'mode': pooling_mode,
+            'max_length': transformer.max_seq_length,
+            'normalize': modules[-1] == 'Normalize',
+        }, handle)
+    os.replace(temp_path, os.path.join(export_dir, 'model.onnx'))
+
+
+class OnnxEncoder:
+    """ONNX Runtime stand-in for SentenceTransformer.encode."""
+
+    def __init__(self, model_name: str):
+        # Imported lazily, like torch: only the ONNX backend needs the runtime.
+        try:  # pragma: no cover - optional inference runtime
+            import onnxruntime as ort
+        except ImportError:
+            raise RuntimeError('onnxruntime missing. Install with: pip install onnxruntime transformers')
+        from transformers import AutoTokenizer
+
+        export_dir = os.path.join(ONNX_CACHE_DIR, model_name.replace('/', '_'))
+        model_path = os.path.join(export_dir, 'model.onnx')
+        pooling_path = os.path.join(export_dir, 'pooling.json')
+        pooling = None
+        if os.path.exists(model_path):
+            with open(pooling_path) as handle:
+                pooling = json.load(handle)
+        if pooling is None or 'normalize' not in pooling:
+            # Exports predating the module check may belong to unsupported models
+            export_onnx_model(model_name, export_dir)
+            with open(pooling_path) as handle:
+                pooling = json.load(handle)
+        self.pooling_mode = pooling['mode']
+        self.max_length = pooling['max_length']
+        self.normalize = pooling['normalize']
+        self.tokenizer = AutoTokenizer.from_pretrained(export_dir)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(model_path, sess_options=options, providers=['CPUExecutionProvider'])
+        self.input_names = [node.name for node in self.session.get_inputs()]
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False, **_):
+        batches = []
+        for start in range(0, len(texts), batch_size):
+            tokens = self.tokenizer(
+                list(texts[start:start + batch_size]),
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors='np',
+            )
+            feeds = {name: tokens[name].astype(np.int64) for name in self.input_names}
+            hidden = self.session.run(None, feeds)[0]
+            if self.pooling_mode == 'cls':
+                pooled = hidden[:, 0]
+            else:
+                mask = tokens['attention_mask'][..., None].astype(np.float32)
+                pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            batches.append(pooled.astype(np.float32))
+
+        if not batches:
+            return np.zeros((0, 0), dtype=np.float32)
+        embeddings = np.vstack(batches)
+        if normalize_embeddings or self.normalize:
+            embeddings /= np.clip(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12, None)
+        return embeddings
+
+
+def prepare_torch_model(model):
+    """Move a SentenceTransformer to the fastest device, in FP16 on GPUs."""
+    import torch
+
+    if torch.cuda.is_available():
+        device = 'cuda'
+    elif getattr(torch.backends, 'mps', None) is not None and torch.backends.mps.is_available():
+        device = 'mps'
+    else:
+        device = 'cpu'
+
+    if device == 'cpu':
+        torch.set_num_threads(os.cpu_count() or 1)
+        torch.backends.mkldnn.enabled = True
+    else:
+        model.to(device)
+        model.half()
+    model.embed_device = device
+    return model
+
+
+def get_model(model_name: str, backend: str = 'torch'):
+    if backend not in EMBED_BACKENDS:
+        raise RuntimeError(f"backend must be one of {', '.join(EMBED_BACKENDS)}")
+    key = (model_name, backend)
+    if key not in MODEL_CACHE:
+        if backend == 'onnx':
+            MODEL_CACHE[key] = OnnxEncoder(model_name)
+        else:
+            MODEL_CACHE[key] = prepare_torch_model(load_sentence_transformer_class()(model_name))
+    return MODEL_CACHE[key]
+
+
+def inference_context(model):
+    """Disable autograd bookkeeping for torch models; no-op for ONNX."""
+    if hasattr(model, 'embed_device'):
+        import torch
+        return torch.inference_mode()
+    return contextlib.nullcontext()
+
+
+def encode_texts(model, texts, batch_size: int):
+    """Encode ``texts`` in length order so each batch pads to similar lengths."""
+    if len(texts) == 1:
+        order = np.zeros(1, dtype=np.intp)
+        batch_size = 1
+    else:
+        order = np.argsort([len(text) for text in texts], kind='stable')
+    sorted_texts = [texts[i] for i in order]
+    device = getattr(model, 'embed_device', 'cpu')
+    with inference_context(model):
+        if device == 'cpu':
+            embeddings = model.encode(
+                sorted_texts,
+                batch_size=batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+        else:
+            # Keep batches on the accelerator and copy back once at the end.
+            embeddings = model.encode(
+                sorted_texts,
+                batch_size=batch_size,
+                normalize_embeddings=True,
+                convert_to_tensor=True,
+                device=device,
+                show_progress_bar=False,
+            ).float().cpu().numpy()
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if len(texts) == 1:
+        return embeddings
+    inverse = np.empty_like(order)
+    inverse[order] = np.arange(len(order))
+    return embeddings[inverse]
+
+
+def encode_query(model, query: str):
+    with inference_context(model):
+        embedding = model.encode([query], normalize_embeddings=True, show_progress_bar=False)[0]
+    return np.asarray(embedding, dtype=np.float32)
 
 
 def serialize_vector(vector) -> bytes:
@@ -128,30 +468,264 @@ def serialize_vector(vector) -> bytes:
     return array.tobytes()
 
 
-def deserialize_vector(blob: bytes):
-    return np.frombuffer(blob, dtype=np.float32)
+def get_vectors_path(db_path: str) -> str:
+    return os.path.join(os.path.dirname(db_path), VECTORS_FILENAME)
+
+
+def write_vector_slots(vectors_path: str, slots, vectors, reset: bool = False):
+    """Write each vector into its slot of the (N, D) float32 sidecar file."""
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    row_bytes = matrix.shape[1] * FLOAT32_BYTES
+    mode = 'r+b' if os.path.exists(vectors_path) and not reset else 'w+b'
+    with open(vectors_path, mode) as handle:
+        # Sorting by (slot, position) keeps appends sequential and lets the
+        # last duplicate id in a payload win, matching INSERT OR REPLACE.
+        for slot, position in sorted(zip(slots, range(len(slots)))):
+            handle.seek(slot * row_bytes)
+            handle.write(matrix[position].tobytes())
+        handle.flush()
+        os.fsync(handle.fileno())
+
+
+def rebuild_vector_store(conn: sqlite3.Connection, vectors_path: str, version):
+    """Rewrite the sidecar from the SQLite blobs and renumber slots densely."""
+    rowids = []
+
+    def blobs():
+        # Stream straight from the cursor so only the rowids are retained,
+        # never every vector blob at once.
+        for rowid, vector_blob in conn.execute('SELECT rowid, vector FROM documents ORDER BY rowid'):
+            rowids.append(rowid)
+            yield vector_blob
+
+    temp_path = f'{vectors_path}.tmp'
+    with open(temp_path, 'wb') as handle:
+        handle.writelines(blobs())
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(temp_path, vectors_path)
+
+    conn.executemany(
+        'UPDATE documents SET slot = ? WHERE rowid = ?',
+        [(slot, rowid) for slot, rowid in enumerate(rowids)]
+    )
+    conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('vectors_version', repr(version)))
+    conn.commit()
+
+
+def open_vector_store(vectors_path: str, count: int, dimension: int):
+    """Memory-map the sidecar as a read-only (count, dimension) matrix."""
+    try:
+        if os.path.getsize(vectors_path) < count * dimension * FLOAT32_BYTES:
+            return None
+    except OSError:
+        return None
+    return np.memmap(vectors_path, dtype=np.float32, mode='r', shape=(count, dimension))
+
+
+def quantize_int8(vectors):
+    """Symmetric per-row int8 quantization; returns (codes, scales)."""
+    matrix = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.rint(matrix / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def load_quantized_store(conn: sqlite3.Connection, db_path: str, cache_entry):
+    """Return (codes, scales) for the cached matrix, rebuilding the int8 sidecar if stale."""
+    if 'int8' in cache_entry:
+        return cache_entry['int8']
+
+    index_dir = os.path.dirname(db_path)
+    codes_path = os.path.join(index_dir, INT8_VECTORS_FILENAME)
+    scales_path = os.path.join(index_dir, INT8_SCALES_FILENAME)
+    count, dimension = cache_entry['matrix'].shape
+    version = repr(cache_entry['version'])
+
+    row = conn.execute('SELECT value FROM meta WHERE key = ?', ('quantized_version',)).fetchone()
+    fresh = (
+        row is not None and row[0] == version
+        and os.path.exists(codes_path) and os.path.getsize(codes_path) >= count * dimension
+        and os.path.exists(scales_path) and os.path.getsize(scales_path) >= count * FLOAT32_BYTES
+    )
+    if not fresh:
+        with open(codes_path, 'wb') as codes_file, open(scales_path, 'wb') as scales_file:
+            for start in range(0, count, QUANTIZED_BLOCK_ROWS):
+                codes, scales = quantize_int8(cache_entry['matrix'][start:start + QUANTIZED_BLOCK_ROWS])
+                codes_file.write(codes.tobytes())
+                scales_file.write(scales.tobytes())
+        conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('quantized_version', version))
+        conn.commit()
+
+    store = (
+        np.memmap(codes_path, dtype=np.int8, mode='r', shape=(count, dimension)),
+        np.memmap(scales_path, dtype=np.float32, mode='r', shape=(count,)),
+    )
+    cache_entry['int8'] = store
+    return store
 
 
-def ensure_model_meta(conn: sqlite3.Connection, model: str, dimension: int):
+def score_int8(codes, scales, query_vec):
+    """Approximate inner products against int8 codes with exact int32 accumulation."""
+    query_codes, query_scales = quantize_int8(query_vec)
+    query_i32 = query_codes[0].astype(np.int32)
+    scores = np.empty(codes.shape[0], dtype=np.float32)
+    # Widen one block at a time so the int32 copy stays cache-sized.
+    for start in range(0, codes.shape[0], QUANTIZED_BLOCK_ROWS):
+        stop = start + QUANTIZED_BLOCK_ROWS
+        scores[start:stop] = codes[start:stop].astype(np.int32) @ query_i32
+    scores *= scales
+    scores *= query_scales[0]
+    return scores
+
+
+def get_hnsw_path(db_path: str) -> str:
+    return os.path.join(os.path.dirname(db_path), HNSW_FILENAME)
+
+
+def load_hnsw_index(conn: sqlite3.Connection, db_path: str, cache_entry):
+    """Return an HNSW graph over the cached matrix, labelled by slot.
+
+    The persisted graph is reused when its version matches the index;
+    otherwise it is rebuilt from the matrix and saved.
+    """
+    if 'hnsw' in cache_entry:
+        return cache_entry['hnsw']
+
+    hnsw_path = get_hnsw_path(db_path)
+    matrix = cache_entry['matrix']
+    count, dimension = matrix.shape
+    version = repr(cache_entry['version'])
+
+    index = None
+    row = conn.execute('SELECT value FROM meta WHERE key = ?', ('hnsw_version',)).fetchone()
+    if row is not None and row[0] == version and os.path.exists(hnsw_path):
+        index = hnswlib.Index(space='ip', dim=dimension)
+        index.load_index(hnsw_path)
+        if index.get_current_count() != count:
+            index = None
+
+    if index is None:
+        index = hnswlib.Index(space='ip', dim=dimension)
+        index.init_index(max_elements=count, ef_construction=HNSW_EF_CONSTRUCTION, M=HNSW_M)
+        index.add_items(np.asarray(matrix), np.arange(count))
+        index.save_index(hnsw_path)
+        conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('hnsw_version', version))
+        conn.commit()
+
+    cache_entry['hnsw'] = index
+    return index
+
+
+def update_hnsw_index(hnsw_path: str, dimension: int, slots, vectors, capacity: int) -> bool:
+    """Add or replace vectors in the persisted HNSW graph; False if there is none."""
+    if not os.path.exists(hnsw_path):
+        return False
+    index = hnswlib.Index(space='ip', dim=dimension)
+    index.load_index(hnsw_path)
+    if capacity > index.get_max_elements():
+        index.resize_index(max(capacity, 2 * index.get_max_elements()))
+    index.add_items(np.asarray(vectors, dtype=np.float32), np.asarray(slots))
+    index.save_index(hnsw_path)
+    return True
+
+
+def rebuild_vec_table(conn: sqlite3.Connection, cache_entry):
+    """Recreate the sqlite-vec table from the cached matrix."""
+    matrix = cache_entry['matrix']
+    conn.execute(f'DROP TABLE IF EXISTS {VEC_TABLE}')
+    conn.execute(
+        f'CREATE VIRTUAL TABLE {VEC_TABLE} USING vec0(id TEXT PRIMARY KEY, embedding float[{matrix.shape[1]}])'
+    )
+    conn.executemany(
+        f'INSERT INTO {VEC_TABLE}(id, embedding) VALUES (?, ?)',
+        ((doc_id, serialize_vector(matrix[position])) for position, (doc_id, _) in enumerate(cache_entry['rows']))
+    )
+    conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('vec_version', repr(cache_entry['version'])))
+    conn.commit()
+
+
+def update_vec_table(conn: sqlite3.Connection, doc_ids, vectors):
+    """Replace the given documents' rows in the sqlite-vec table."""
+    # vec0 has no INSERT OR REPLACE; later duplicates in a payload win.
+    latest = {doc_id: position for position, doc_id in enumerate(doc_ids)}
+    conn.executemany(f'DELETE FROM {VEC_TABLE} WHERE id = ?', [(doc_id,) for doc_id in latest])
+    conn.executemany(
+        f'INSERT INTO {VEC_TABLE}(id, embedding) VALUES (?, ?)',
+        [(doc_id, serialize_vector(vectors[position])) for doc_id, position in latest.items()]
+    )
+
+
+def search_vec_table(conn: sqlite3.Connection, query_vec, limit: int, min_score: float):
+    """Run KNN inside SQLite and join metadata in the same statement."""
+    cursor = conn.execute(
+        f'WITH knn AS (SELECT id, distance FROM {VEC_TABLE} WHERE embedding MATCH ? AND k = ?) '
+        'SELECT d.id, d.metadata, knn.distance FROM knn JOIN documents d ON d.id = knn.id '
+        'ORDER BY knn.distance',
+        (serialize_vector(query_vec), limit)
+    )
+    results = []
+    for doc_id, metadata_json, distance in cursor:
+        # vec0 reports L2 distance; for unit vectors <a, b> = 1 - d^2 / 2.
+        score = 1.0 - distance * distance / 2.0
+        if score < min_score:
+            break
+        results.append({
+            "id": doc_id,
+            "score": score,
+            "metadata": decode_metadata(metadata_json),
+        })
+    return results
+
+
+def ensure_model_meta(conn: sqlite3.Connection, model: str, dimension: int) -> bool:
+    """Record model/dimension metadata; return True if the index was reset."""
     cur = conn.execute('SELECT value FROM meta WHERE key = ?', ('model',))
     row = cur.fetchone()
     if row is None:
         conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('model', model))
         conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('dimension', str(dimension)))
         conn.commit()
-        return
+        return False
 
     existing_model = row[0]
     if existing_model != model:
         # Reset index for new model
         conn.execute('DELETE FROM documents')
+        conn.execute("DELETE FROM meta WHERE key IN ('count', 'last_updated')")
         conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('model', model))
         conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('dimension', str(dimension)))
         conn.commit()
-        return
+        return True
 
     conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('dimension', str(dimension)))
     conn.commit()
+    return False
+
+
+def read_counters(conn: sqlite3.Connection):
+    """Return (document count, last updated_at) from the meta counters.
+
+    Indexes written before the counters existed are backfilled once with a
+    COUNT(*)/MAX() scan; upserts keep them current from then on.
+    """
+    meta = dict(conn.execute("SELECT key, value FROM meta WHERE key IN ('count', 'last_updated')"))
+    if 'count' not in meta:
+        in_transaction = conn.in_transaction
+        count, last_updated = conn.execute('SELECT COUNT(*), MAX(updated_at) FROM documents').fetchone()
+        write_counters(conn, count, last_updated)
+        if not in_transaction:
+            conn.commit()
+        return count, last_updated
+    last_updated = meta.get('last_updated')
+    return int(meta['count']), float(last_updated) if last_updated is not None else None
+
+
+def write_counters(conn: sqlite3.Connection, count: int, last_updated):
+    conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('count', str(count)))
+    if last_updated is not None:
+        conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('last_updated', repr(last_updated)))
 
 
 def command_status(payload):
@@ -164,7 +738,7 @@ def command_status(payload):
     ensure_dir(index_path)
 
     try:
-        with closing(with_connection(db_path)) as conn:
+        with with_connection(db_path) as conn:
             ensure_schema(conn)
     except Exception as exc:  # pragma: no cover - IO errors
         return {"status": "error", "error": str(exc)}
@@ -172,12 +746,24 @@ def command_status(payload):
     return {"status": "ok", "indexPath": index_path, "model": model}
 
 
+def content_hasher(model: str):
+    """Return a function hashing document text for ``model``.
+
+    The hash is only a change-detection key, so it uses xxh3 when available
+    and BLAKE2b otherwise rather than a cryptographic digest.
+    """
+    prefix = f'{model}|'.encode('utf-8')
+    if xxhash is not None:
+        def digest(text: str) -> str:
+            return xxhash.xxh3_128(prefix + (text or '').encode('utf-8')).hexdigest()
+    else:
+        def digest(text: str) -> str:
+            return hashlib.blake2b(prefix + (text or '').encode('utf-8'), digest_size=16).hexdigest()
+    return digest
+
+
 def compute_hash(text: str, model: str) -> str:
-    sha = hashlib.sha1()
-    sha.update(model.encode('utf-8'))
-    sha.update(b'|')
-    sha.update((text or '').encode('utf-8'))
-    return sha.hexdigest()
+    return content_hasher(model)(text)
 
 
 def command_upsert(payload):
@@ -190,72 +776,155 @@ def command_upsert(payload):
     if not documents:
         return {"status": "ok", "updated": 0}
 
-    model = get_model(model_name)
+    backend = payload.get('backend') or 'torch'
     db_path = get_db_path(index_path)
 
-    with closing(with_connection(db_path)) as conn:
+    with with_connection(db_path) as conn:
         ensure_schema(conn)
 
+        # Stage the payload ids in a temp table and join on the primary key:
+        # one fixed statement regardless of batch size, and no
+        # SQLITE_MAX_VARIABLE_NUMBER limit on the number of documents.
+        conn.execute('CREATE TEMP TABLE IF NOT EXISTS upsert_ids (id TEXT PRIMARY KEY)')
+        conn.execute('DELETE FROM upsert_ids')
+        conn.executemany('INSERT OR IGNORE INTO upsert_ids(id) VALUES (?)', [(doc['id'],) for doc in documents])
         existing = {}
-        cursor = conn.execute('SELECT id, content_hash FROM documents WHERE id IN (%s)' %
-                              ','.join('?' for _ in documents), [doc['id'] for doc in documents])
+        cursor = conn.execute(
+            'SELECT d.id, d.content_hash, d.slot FROM documents d JOIN upsert_ids i ON d.id = i.id'
+        )
         for row in cursor.fetchall():
-            existing[row[0]] = row[1]
+            existing[row[0]] = (row[1], row[2])
+        conn.commit()
 
+        hash_text = content_hasher(model_name)
         to_embed = []
         for doc in documents:
-            content_hash = doc.get('hash') or compute_hash(doc.get('text', ''), model_name)
-            if existing.get(doc['id']) == content_hash:
+            content_hash = doc.get('hash') or hash_text(doc.get('text', ''))
+            if existing.get(doc['id'], (None, None))[0] == content_hash:
                 continue
             to_embed.append((doc['id'], doc.get('text', ''), content_hash, doc.get('metadata', {})))
 
         if not to_embed:
             return {"status": "ok", "updated": 0}
 
+        # Load the model only once something needs embedding: an upsert where
+        # every hash matches never pays for the torch/ONNX start-up.
+        model = get_model(model_name, backend)
+
         texts = [item[1] for item in to_embed]
         validated_batch_size = validate_batch_size(payload.get('batchSize'))
-        embeddings = model.encode(texts, batch_size=validated_batch_size, normalize_embeddings=True)
-
-        dimension = len(embeddings[0]) if embeddings else 0
-        ensure_model_meta(conn, model_name, dimension)
+        embeddings = encode_texts(model, texts, validated_batch_size)
+
+        dimension = len(embeddings[0]) if len(embeddings) else 0
+        reset = ensure_model_meta(conn, model_name, dimension)
+
+        # Take the write lock up front so slot assignment and the row writes
+        # land in one transaction.
+        conn.execute('BEGIN IMMEDIATE')
+        versions = dict(conn.execute(
+            "SELECT key, value FROM meta WHERE key IN ('vectors_version', 'hnsw_version', 'vec_version')"
+        ))
+        count, _ = read_counters(conn)
+        # Re-read under the lock: a concurrent upsert may have added some of
+        # these ids since the hash check above.
+        stored = dict(conn.execute(
+            'SELECT d.id, d.slot FROM documents d JOIN upsert_ids i ON d.id = i.id'
+        ))
+
+        # Changed documents keep their slot in the vectors sidecar; new ones
+        # are appended after the highest slot in use.
+        next_slot = conn.execute('SELECT COALESCE(MAX(slot) + 1, 0) FROM documents').fetchone()[0]
+        assigned = {doc_id: slot for doc_id, slot in stored.items() if slot is not None}
+        slots = []
+        for doc_id, _, _, _ in to_embed:
+            if doc_id not in assigned:
+                assigned[doc_id] = next_slot
+                next_slot += 1
+            slots.append(assigned[doc_id])
 
         now = time.time()
-        for (doc_id, _, content_hash, metadata), embedding in zip(to_embed, embeddings):
-            vector_blob = serialize_vector(embedding)
-            conn.execute(
-                'INSERT OR REPLACE INTO documents(id, content_hash, metadata, vector, updated_at) VALUES (?, ?, ?, ?, ?)',
-                (doc_id, content_hash, json.dumps(metadata), vector_blob, now)
-            )
+        vector_buffer = memoryview(serialize_vector(embeddings))
+        row_bytes = dimension * FLOAT32_BYTES
+        metadata_json = [json_dumps(item[3]) for item in to_embed]
+        conn.executemany(
+            'INSERT OR REPLACE INTO documents(id, content_hash, metadata, vector, updated_at, slot) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            [
+                (doc_id, content_hash, metadata_json[position],
+                 vector_buffer[position * row_bytes:(position + 1) * row_bytes], now, slot)
+                for position, ((doc_id, _, content_hash, _), slot) in enumerate(zip(to_embed, slots))
+            ]
+        )
+        conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('vectors_version', repr(now)))
+        added = {item[0] for item in to_embed}.difference(stored)
+        write_counters(conn, count + len(added), now)
+
+        # Extend the HNSW graph in place when it was current before this
+        # upsert; otherwise the next search rebuilds it.
+        hnsw_current = (
+            hnswlib is not None and not reset
+            and versions.get('hnsw_version') is not None
+            and versions.get('hnsw_version') == versions.get('vectors_version')
+        )
+        if hnsw_current and update_hnsw_index(get_hnsw_path(db_path), dimension, slots, embeddings, next_slot):
+            conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('hnsw_version', repr(now)))
+
+        vec_current = (
+            conn.vec_enabled and not reset
+            and versions.get('vec_version') is not None
+            and versions.get('vec_version') == versions.get('vectors_version')
+        )
+        if vec_current:
+            update_vec_table(conn, [item[0] for item in to_embed], embeddings)
+            conn.execute('INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)', ('vec_version', repr(now)))
 
+        # The sidecar is not transactional: write it only once every row is in
+        # place, and if that fails mark it stale so search rebuilds it.
+        try:
+            write_vector_slots(get_vectors_path(db_path), slots, embeddings, reset=reset)
+        except BaseException:
+            conn.rollback()
+            conn.execute("DELETE FROM meta WHERE key = 'vectors_version'")
+            conn.commit()
+            raise
         conn.commit()
-        INDEX_CACHE.pop(db_path, None)
+        if reset or not update_index_cache(
+            db_path, versions.get('vectors_version'), slots,
+            [item[0] for item in to_embed], metadata_json, embeddings, now,
+        ):
+            INDEX_CACHE.pop(db_path, None)
 
         return {"status": "ok", "updated": len(to_embed)}
 
 
 def load_index_cache(conn: sqlite3.Connection, db_path: str):
-    cursor = conn.execute('SELECT MAX(updated_at) FROM documents')
-    row = cursor.fetchone()
-    latest = row[0] if row and row[0] is not None else 0
+    _, latest = read_counters(conn)
+    if latest is None:
+        latest = 0
 
     cached = INDEX_CACHE.get(db_path)
     if cached and cached['version'] == latest:
         return cached
 
-    rows = []
-    vectors = []
-    for doc_id, metadata_json, vector_blob in conn.execute('SELECT id, metadata, vector FROM documents'):
-        try:
-            metadata = json.loads(metadata_json) if metadata_json else {}
-        except json.JSONDecodeError:
-            metadata = {"raw": metadata_json}
-        rows.append((doc_id, metadata))
-        vectors.append(deserialize_vector(vector_blob))
-
-    if vectors:
-        matrix = np.vstack(vectors)
-    else:
+    count, with_slot, max_slot = conn.execute(
+        'SELECT COUNT(*), COUNT(slot), MAX(slot) FROM documents'
+    ).fetchone()
+    meta = dict(conn.execute('SELECT key, value FROM meta'))
+    dimension = int(meta.get('dimension') or 0)
+    vectors_path = get_vectors_path(db_path)
+
+    matrix = None
+    if count == 0:
         matrix = np.zeros((0, 1), dtype=np.float32)
+    elif meta.get('vectors_version') == repr(latest) and with_slot == count and max_slot == count - 1:
+        matrix = open_vector_store(vectors_path, count, dimension)
+    if matrix is None:
+        rebuild_vector_store(conn, vectors_path, latest)
+        matrix = open_vector_store(vectors_path, count, dimension)
+
+    # Slots are dense, so row i of the memory-mapped matrix belongs to the
+    # document with slot i. Metadata stays encoded until a row is returned.
+    rows = conn.execute('SELECT id, metadata FROM documents ORDER BY slot').fetchall()
 
     cache_entry = {
         'version': latest,
@@ -266,48 +935,183 @@ def load_index_cache(conn: sqlite3.Connection, db_path: str):
     return cache_entry
 
 
+def update_index_cache(db_path: str, previous_version, slots, doc_ids, metadata_json, vectors, version) -> bool:
+    """Apply an upsert to the in-process cache in place.
+
+    The cached matrix becomes a view over a growable buffer, so changed rows
+    are overwritten and new rows appended without rebuilding the index.
+    Returns False when the cache was not current before the upsert.
+    """
+    cached = INDEX_CACHE.get(db_path)
+    if cached is None or previous_version is None or repr(cached['version']) != previous_version:
+        return False
+
+    count, dimension = cached['matrix'].shape
+    if dimension != vectors.shape[1]:
+        return False
+    needed = max(count, max(slots) + 1)
+    buffer = cached.get('buffer')
+    if buffer is None or needed > buffer.shape[0]:
+        # Amortized doubling; the first upsert also copies the memory-mapped
+        # sidecar into memory that this process owns.
+        capacity = max(needed, 2 * (buffer.shape[0] if buffer is not None else count))
+        grown = np.empty((capacity, dimension), dtype=np.float32)
+        grown[:count] = cached['matrix']
+        buffer = grown
+
+    rows = cached['rows']
+    for slot, position in sorted(zip(slots, range(len(slots)))):
+        buffer[slot] = vectors[position]
+        if slot < len(rows):
+            rows[slot] = (doc_ids[position], metadata_json[position])
+        else:
+            rows.append((doc_ids[position], metadata_json[position]))
+
+    cached.update(buffer=buffer, matrix=buffer[:needed], version=version)
+    # Derived structures were built for the old matrix.
+    cached.pop('int8', None)
+    cached.pop('hnsw', None)
+    return True
+
+
+def load_topk_dot():
+    """Return the jitted fused top-k kernel, or None when numba is missing."""
+    # Imported lazily: numba adds ~200 ms to every start, and only large
+    # brute-force searches use the kernel.
+    if 'topk_dot' in KERNEL_CACHE:
+        return KERNEL_CACHE['topk_dot']
+    try:  # pragma: no cover - optional JIT for the brute-force kernel
+        # Persist compiled kernels so only the first process pays for JIT.
+        os.environ.setdefault('NUMBA_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'memindex', 'numba'))
+        import numba
+    except ImportError:
+        KERNEL_CACHE['topk_dot'] = None
+        return None
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def topk_dot(matrix, query, k):
+        """Fused dot product and per-chunk top-k; returns unmerged candidates."""
+        count, dimension = matrix.shape
+        chunks = min(NUMBA_CHUNKS, count)
+        per_chunk = (count + chunks - 1) // chunks
+        best_scores = np.full((chunks, k), -np.inf, dtype=np.float32)
+        best_ids = np.full((chunks, k), -1, dtype=np.int64)
+        for chunk in numba.prange(chunks):
+            for row in range(chunk * per_chunk, min((chunk + 1) * per_chunk, count)):
+                score = np.float32(0.0)
+                for col in range(dimension):
+                    score += matrix[row, col] * query[col]
+                if score <= best_scores[chunk, k - 1]:
+                    continue
+                # Insert into this chunk's descending list.
+                slot = k - 1
+                while slot > 0 and best_scores[chunk, slot - 1] < score:
+                    best_scores[chunk, slot] = best_scores[chunk, slot - 1]
+                    best_ids[chunk, slot] = best_ids[chunk, slot - 1]
+                    slot -= 1
+                best_scores[chunk, slot] = score
+                best_ids[chunk, slot] = row
+        return best_ids.ravel(), best_scores.ravel()
+
+    KERNEL_CACHE['topk_dot'] = topk_dot
+    return topk_dot
+
+
+def top_k_indices(scores, limit: int):
+    """Return indices of the ``limit`` highest scores, best first."""
+    if limit <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.intp)
+    if limit >= scores.size:
+        return np.argsort(-scores, kind='stable')
+    top = np.argpartition(-scores, limit - 1)[:limit]
+    return top[np.argsort(-scores[top], kind='stable')]
+
+
 def command_search(payload):
     index_path = payload.get('indexPath')
     model_name = payload.get('model')
     query = payload.get('query')
     limit = int(payload.get('limit') or 8)
     min_score = float(payload.get('minScore') or 0)
+    quantization = payload.get('quantization') or 'float32'
 
     if not index_path or not model_name or not query:
         return {"status": "error", "error": "indexPath, model, and query required"}
+    if quantization not in QUANTIZATIONS:
+        return {"status": "error", "error": f"quantization must be one of {', '.join(QUANTIZATIONS)}"}
 
-    model = get_model(model_name)
     db_path = get_db_path(index_path)
 
-    with closing(with_connection(db_path)) as conn:
+    with with_connection(db_path) as conn:
         ensure_schema(conn)
+        count, latest = read_counters(conn)
+        if count == 0:
+            return {"status": "ok", "results": []}
+        model = get_model(model_name, payload.get('backend') or 'torch')
+
+        use_hnsw = hnswlib is not None and quantization == 'float32' and count >= HNSW_MIN_DOCUMENTS
+        use_vec = conn.vec_enabled and quantization == 'float32' and not use_hnsw
+        if use_vec:
+            row = conn.execute('SELECT value FROM meta WHERE key = ?', ('vec_version',)).fetchone()
+            if row is not None and row[0] == repr(latest):
+                query_vec = encode_query(model, query)
+                return {"status": "ok", "results": search_vec_table(conn, query_vec, limit, min_score)}
+
         cache_entry = load_index_cache(conn, db_path)
+        count = cache_entry['matrix'].shape[0]
+        if quantization == 'int8':
+            codes, scales = load_quantized_store(conn, db_path, cache_entry)
+        elif use_hnsw:
+            hnsw_index = load_hnsw_index(conn, db_path, cache_entry)
+        elif use_vec:
+            # Stale or missing vec table: answer from NumPy this time and
+            # rebuild it so later searches stay inside SQLite.
+            rebuild_vec_table(conn, cache_entry)
 
     matrix = cache_entry['matrix']
     if matrix.shape[0] == 0:
         return {"status": "ok", "results": []}
 
-    query_vector = model.encode([query], normalize_embeddings=True)[0]
-    query_vec = np.asarray(query_vector, dtype=np.float32)
-    scores = matrix.dot(query_vec)
-
-    if scores.ndim == 0:
-        scores = np.asarray([scores], dtype=np.float32)
+    query_vec = encode_query(model, query)
+    if use_hnsw:
+        k = min(limit, count)
+        hnsw_index.set_ef(max(HNSW_EF_SEARCH, k))
+        labels, distances = hnsw_index.knn_query(query_vec, k=k)
+        # hnswlib reports inner-product distance as 1 - <a, b>.
+        candidates = labels[0]
+        scores = dict(zip(candidates.tolist(), (1.0 - distances[0]).tolist()))
+    elif quantization == 'int8':
+        # Oversample on the approximate int8 scores, then rerank the
+        # shortlist against the float32 rows so returned scores are exact.
+        # Sorted row order keeps the memory-mapped gather sequential.
+        shortlist = np.sort(top_k_indices(score_int8(codes, scales, query_vec), limit * 2))
+        exact = np.asarray(matrix[shortlist] @ query_vec)
+        best = top_k_indices(exact, limit)
+        candidates = shortlist[best]
+        scores = dict(zip(candidates.tolist(), exact[best].tolist()))
+    elif matrix.size >= NUMBA_MIN_WORK and (topk_dot := load_topk_dot()) is not None:
+        # Large brute-force scans skip the full score vector entirely.
+        ids, chunk_scores = topk_dot(np.asarray(matrix), query_vec, min(limit, count))
+        valid = ids >= 0
+        ids, chunk_scores = ids[valid], chunk_scores[valid]
+        best = top_k_indices(chunk_scores, limit)
+        candidates = ids[best]
+        scores = dict(zip(candidates.tolist(), chunk_scores[best].tolist()))
+    else:
+        scores = np.atleast_1d(matrix @ query_vec)
+        candidates = top_k_indices(scores, limit)
 
-    order = np.argsort(scores)[::-1]
     results = []
-    for idx in order:
+    for idx in candidates:
         score = float(scores[idx])
         if score < min_score:
-            continue
-        doc_id, metadata = cache_entry['rows'][idx]
+            break
+        doc_id, metadata_json = cache_entry['rows'][idx]
         results.append({
             "id": doc_id,
             "score": score,
-            "metadata": metadata,
+            "metadata": decode_metadata(metadata_json),
         })
-        if len(results) >= limit:
-            break
 
     return {"status": "ok", "results": results}
 
@@ -319,10 +1123,9 @@ def command_stats(payload):
         return {"status": "error", "error": "indexPath and model required"}
 
     db_path = get_db_path(index_path)
-    with closing(with_connection(db_path)) as conn:
+    with with_connection(db_path) as conn:
         ensure_schema(conn)
-        cur = conn.execute('SELECT COUNT(*), MAX(updated_at) FROM documents')
-        count, updated_at = cur.fetchone()
+        count, updated_at = read_counters(conn)
         meta = dict(conn.execute('SELECT key, value FROM meta'))
 
     return {
@@ -345,26 +1148,26 @@ COMMANDS = {
 
 def main():
     if len(sys.argv) < 2:
-        print(json.dumps({"status": "error", "error": "command required"}))
+        write_response({"status": "error", "error": "command required"})
         return
 
     command = sys.argv[1]
     handler = COMMANDS.get(command)
     if handler is None:
-        print(json.dumps({"status": "error", "error": f"unknown command: {command}"}))
+        write_response({"status": "error", "error": f"unknown command: {command}"})
         return
 
     payload = load_payload()
     try:
         result = handler(payload)
     except RuntimeError as exc:
-        print(json.dumps({"status": "error", "error": str(exc)}))
+        write_response({"status": "error", "error": str(exc)})
         return
     except Exception as exc:  # pragma: no cover - general guard
-        print(json.dumps({"status": "error", "error": str(exc)}))
+        write_response({"status": "error", "error": str(exc)})
         return
 
-    print(json.dumps(result))
+    write_response(result)
 
 
 if __name__ == '__main__':
@@ -6,6 +6,7 @@ Generates boilerplate code, tests, data, and scaffolding
 
 import os
 import sys
+import copy
 import json
 import random
 import string
@@ -13,13 +14,269 @@ from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; data generation falls back to random
+    np = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; json is used when it is missing
+    orjson = None
+
+FIRST_NAMES = ("James", "Sarah", "Michael", "Emily", "Robert", "Jessica")
+LAST_NAMES = ("Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia")
+DATE_START = datetime(1950, 1, 1)
+DATE_END = datetime(2005, 12, 31)
+
+if np is not None:
+    FIRST_NAMES_ARR = np.array(FIRST_NAMES)
+    LAST_NAMES_ARR = np.array(LAST_NAMES)
+    # byte -> two hex digits, and where the 32 digits land in a 36-char UUID
+    HEX_DIGITS = np.array([b'%02x' % i for i in range(256)], dtype='S2')
+    UUID_DIGIT_POSITIONS = [i for i in range(36) if i not in (8, 13, 18, 23)]
+
+# Parsed .codegenrc.json contents keyed by (path, mtime_ns, size)
+CONFIG_CACHE = {}
+
+# Records generated and written per batch by generate_data
+DATA_BLOCK_ROWS = 10000
+
+# Output subdirectories of a crud_api boilerplate
+CRUD_DIRS = ("models", "controllers", "services", "routes", "validators")
+
+# Schema field type -> TypeScript / SQLAlchemy column type
+TS_TYPE_MAP = {
+    "uuid": "string",
+    "string": "string",
+    "integer": "number",
+    "datetime": "Date",
+    "boolean": "boolean",
+    "decimal": "number"
+}
+
+PY_TYPE_MAP = {
+    "uuid": "String(36)",
+    "string": "String(255)",
+    "integer": "Integer",
+    "datetime": "DateTime",
+    "boolean": "Boolean"
+}
+
+# Field flag -> TypeORM decorator, in priority order; first match wins
+TS_DECORATORS = (
+    ("primary_key", "  @PrimaryGeneratedColumn('uuid')"),
+    ("unique", "  @Column({ unique: true })"),
+    ("auto_now_add", "  @CreateDateColumn()"),
+    ("auto_now", "  @UpdateDateColumn()"),
+)
+
+# Field flag -> SQLAlchemy Column keyword; every match applies
+PY_CONSTRAINTS = (
+    ("primary_key", "primary_key=True"),
+    ("unique", "unique=True"),
+    ("required", "nullable=False"),
+)
+
+TYPESCRIPT_MODEL_TEMPLATE = """import { Entity, Column } from 'typeorm';
+
+@Entity()
+export class {entity_name} {
+  @Column()
+  id: string;
+}
+"""
+
+TYPESCRIPT_CONTROLLER_TEMPLATE = """import { Request, Response } from 'express';
+import { {entity_name}Service } from '../services/{entity_name}Service';
+
+export class {entity_name}Controller {
+  private service = new {entity_name}Service();
+
+  async getAll(req: Request, res: Response) {
+    const items = await this.service.findAll();
+    return res.json(items);
+  }
+
+  async getById(req: Request, res: Response) {
+    const item = await this.service.findById(req.params.id);
+    return res.json(item);
+  }
+
+  async create(req: Request, res: Response) {
+    const item = await this.service.create(req.body);
+    return res.status(201).json(item);
+  }
+
+  async update(req: Request, res: Response) {
+    const item = await this.service.update(req.params.id, req.body);
+    return res.json(item);
+  }
+
+  async delete(req: Request, res: Response) {
+    await this.service.delete(req.params.id);
+    return res.status(204).send();
+  }
+}
+"""
+
+TYPESCRIPT_SERVICE_TEMPLATE = """import { {entity_name} } from '../models/{entity_name}';
+
+export class {entity_name}Service {
+  async findAll(): Promise<{entity_name}[]> {
+    // Implementation
+    return [];
+  }
+
+  async findById(id: string): Promise<{entity_name}> {
+    // Implementation
+    return {} as {entity_name};
+  }
+
+  async create(data: Partial<{entity_name}>): Promise<{entity_name}> {
+    // Implementation
+    return {} as {entity_name};
+  }
+
+  async update(id: string, data: Partial<{entity_name}>): Promise<{entity_name}> {
+    // Implementation
+    return {} as {entity_name};
+  }
+
+  async delete(id: string): Promise<void> {
+    // Implementation
+  }
+}
+"""
+
+TYPESCRIPT_TEST_TEMPLATE = """import { {entity_name}Service } from '../../src/services/{entity_name}Service';
+
+describe('{entity_name}Service', () => {
+  let service: {entity_name}Service;
+
+  beforeEach(() => {
+    service = new {entity_name}Service();
+  });
+
+  describe('findAll', () => {
+    it('should return all items', async () => {
+      const items = await service.findAll();
+      expect(Array.isArray(items)).toBe(true);
+    });
+  });
+
+  describe('create', () => {
+    it('should create new item', async () => {
+      const data = { /* test data */ };
+      const item = await service.create(data);
+      expect(item).toBeDefined();
+    });
+  });
+});
+"""
+
+PYTHON_MODEL_TEMPLATE = """from sqlalchemy import Column, String
+from .base import Base
+
+class {entity_name}(Base):
+    __tablename__ = '{entity_lower}s'
+
+    id = Column(String, primary_key=True)
+"""
+
+PYTHON_TEST_TEMPLATE = """import pytest
+from services.{entity_lower}_service import {entity_name}Service
+
+def test_{entity_lower}_creation():
+    service = {entity_name}Service()
+    assert service is not None
+"""
+
+TYPESCRIPT_ROUTES_TEMPLATE = """import { Router } from 'express';
+import { {entity_name}Controller } from '../controllers/{entity_name}Controller';
+import { authenticate } from '../middleware/authenticate';
+
+const router = Router();
+const controller = new {entity_name}Controller();
+
+router.get('/{entity_lower}s', authenticate, controller.getAll);
+router.get('/{entity_lower}s/:id', authenticate, controller.getById);
+router.post('/{entity_lower}s', authenticate, controller.create);
+router.put('/{entity_lower}s/:id', authenticate, controller.update);
+router.delete('/{entity_lower}s/:id', authenticate, controller.delete);
+
+export default router;
+"""
+
+TYPESCRIPT_VALIDATOR_TEMPLATE = """import { body, validationResult } from 'express-validator';
+
+export const {entity_lower}Validators = {
+  create: [
+    body('email').isEmail().normalizeEmail(),
+    body('username').isLength({ min: 3, max: 30 }),
+    body('password').isLength({ min: 8 })
+  ],
+  update: [
+    body('email').optional().isEmail().normalizeEmail(),
+    body('username').optional().isLength({ min: 3, max: 30 })
+  ]
+};
+"""
+
+TEMPLATES = {
+    "typescript": {
+        "model": TYPESCRIPT_MODEL_TEMPLATE,
+        "controller": TYPESCRIPT_CONTROLLER_TEMPLATE,
+        "service": TYPESCRIPT_SERVICE_TEMPLATE,
+        "routes": TYPESCRIPT_ROUTES_TEMPLATE,
+        "validator": TYPESCRIPT_VALIDATOR_TEMPLATE,
+        "test": TYPESCRIPT_TEST_TEMPLATE
+    },
+    "python": {
+        "model": PYTHON_MODEL_TEMPLATE,
+        "test": PYTHON_TEST_TEMPLATE
+    }
+}
+
+
+def render_template(template: str, entity_name: str) -> str:
+    """Fill the entity placeholders of a code template"""
+    return template.replace("{entity_name}", entity_name).replace("{entity_lower}", entity_name.lower())
+
+
+def relative_path(file_path: Path, base: Path) -> str:
+    """str(file_path.relative_to(base)), by string prefix when base is a prefix"""
+    path_str = str(file_path)
+    base_str = str(base)
+    if base_str == ".":
+        if not file_path.is_absolute():
+            return path_str
+    else:
+        prefix = base_str.rstrip(os.sep) + os.sep
+        if path_str.startswith(prefix):
+            return path_str[len(prefix):]
+    return str(file_path.relative_to(base))
+
+
+def dump_json_records(records: List[Dict]) -> bytes:
+    """Serialize records as the items of an indent=2 JSON array, without brackets"""
+    if orjson is not None:
+        # Strip the leading "[" and trailing "\n]" of the full array
+        return orjson.dumps(records, default=str, option=orjson.OPT_INDENT_2)[1:-2]
+    return ("\n  " + ",\n  ".join(
+        json.dumps(record, indent=2, default=str).replace("\n", "\n  ")
+        for record in records
+    )).encode()
+
 
 class AICodeGenerator:
     """Main class for AI code generation operations"""
 
     def __init__(self):
         self.config = self.load_config()
-        self.templates = self.load_templates()
+        self.templates = TEMPLATES
 
     def load_config(self) -> Dict:
         """Load configuration from .codegenrc.json or use defaults"""
@@ -43,9 +300,16 @@ class AICodeGenerator:
 
         if config_file.exists():
             try:
-                with open(config_file, 'r') as f:
-                    user_config = json.load(f)
-                    self.deep_merge(default_config, user_config)
+                stat = config_file.stat()
+                cache_key = (str(config_file.resolve()), stat.st_mtime_ns, stat.st_size)
+                user_config = CONFIG_CACHE.get(cache_key)
+                if user_config is None:
+                    with open(config_file, 'r') as f:
+                        user_config = json.load(f)
+                    CONFIG_CACHE[cache_key] = user_config
+                # deep_merge stores override values by reference; copy so
+                # instances never share (or mutate) the cached dicts
+                self.deep_merge(default_config, copy.deepcopy(user_config))
             except Exception as e:
                 print(f"Warning: Could not load config file: {e}", file=sys.stderr)
 
@@ -53,28 +317,19 @@ class AICodeGenerator:
 
     def deep_merge(self, base: Dict, override: Dict) -> Dict:
         """Deep merge two dictionaries"""
-        for key, value in override.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self.deep_merge(base[key], value)
-            else:
-                base[key] = value
+        # Walk nested dicts with an explicit stack; config values come from
+        # json, so plain type checks are enough
+        stack = [(base, override)]
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                current = target.get(key)
+                if type(current) is dict and type(value) is dict:
+                    stack.append((current, value))
+                else:
+                    target[key] = value
         return base
 
-    def load_templates(self) -> Dict:
-        """Load code generation templates"""
-        return {
-            "typescript": {
-                "model": self.get_typescript_model_template(),
-                "controller": self.get_typescript_controller_template(),
-                "service": self.get_typescript_service_template(),
-                "test": self.get_typescript_test_template()
-            },
-            "python": {
-                "model": self.get_python_model_template(),
-                "test": self.get_python_test_template()
-            }
-        }
-
     def generate_boilerplate(self, type: str, language: str, framework: str,
                             entity: Dict, options: Optional[Dict] = None) -> Dict:
         """Generate boilerplate code"""
@@ -88,26 +343,25 @@ class AICodeGenerator:
         files_generated = []
 
         if type == "crud_api":
-            # Generate model
-            model_file = self.generate_model(language, entity, output_dir)
-            files_generated.append(model_file)
-
-            # Generate controller
-            controller_file = self.generate_controller(language, framework, entity, output_dir)
-            files_generated.append(controller_file)
-
-            # Generate service
-            service_file = self.generate_service(language, entity, output_dir)
-            files_generated.append(service_file)
-
-            # Generate routes
-            routes_file = self.generate_routes(language, framework, entity, output_dir)
-            files_generated.append(routes_file)
-
-            # Generate validator
+            # Create every output directory up front; the generators below
+            # only write files
+            for sub_dir in CRUD_DIRS:
+                (output_dir / sub_dir).mkdir(exist_ok=True)
+
+            # Model, controller, service, routes and validator are
+            # independent files, so write them concurrently
+            tasks = [
+                (self.generate_model, (language, entity, output_dir)),
+                (self.generate_controller, (language, framework, entity, output_dir)),
+                (self.generate_service, (language, entity, output_dir)),
+                (self.generate_routes, (language, framework, entity, output_dir)),
+            ]
             if options.get('include_validation', True):
-                validator_file = self.generate_validator(language, entity, output_dir)
-                files_generated.append(validator_file)
+                tasks.append((self.generate_validator, (language, entity, output_dir)))
+
+            with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+                futures = [executor.submit(generate, *args) for generate, args in tasks]
+                files_generated.extend(future.result() for future in futures)
 
         # Calculate summary
         total_loc = sum(f['lines_of_code'] for f in files_generated)
@@ -146,15 +400,13 @@ class AICodeGenerator:
             content = f"// Model for {entity_name}"
             file_path = output_dir / "models" / f"{entity_name}.txt"
 
-        # Create directory and write file
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(file_path, 'w') as f:
-            f.write(content)
+        # Write file
+        file_path.write_text(content, encoding='utf-8')
 
         return {
-            "path": str(file_path.relative_to(output_dir.parent)),
+            "path": relative_path(file_path, output_dir.parent),
             "type": "model",
-            "lines_of_code": len(content.split('\n')),
+            "lines_of_code": content.count('\n') + 1,
             "content": content[:500] + "..." if len(content) > 500 else content
         }
 
@@ -167,24 +419,21 @@ class AICodeGenerator:
             f"export class {entity_name} {{",
         ]
 
+        ts_type_of = TS_TYPE_MAP.get
         for field in fields:
             field_name = field['name']
             field_type = field['type']
 
             # Map types
-            ts_type = self.map_type_to_typescript(field_type)
+            ts_type = ts_type_of(field_type, "any")
 
             # Add decorators
-            if field.get('primary_key'):
-                lines.append(f"  @PrimaryGeneratedColumn('uuid')")
-            elif field.get('unique'):
-                lines.append(f"  @Column({{ unique: true }})")
-            elif field.get('auto_now_add'):
-                lines.append(f"  @CreateDateColumn()")
-            elif field.get('auto_now'):
-                lines.append(f"  @UpdateDateColumn()")
+            for flag, decorator in TS_DECORATORS:
+                if field.get(flag):
+                    lines.append(decorator)
+                    break
             else:
-                lines.append(f"  @Column()")
+                lines.append("  @Column()")
 
             # Add property
             lines.append(f"  {field_name}: {ts_type};")
@@ -208,19 +457,13 @@ class AICodeGenerator:
             "",
         ]
 
+        py_type_of = PY_TYPE_MAP.get
         for field in fields:
             field_name = field['name']
             field_type = field['type']
-            py_type = self.map_type_to_python(field_type)
-
-            constraints = []
-            if field.get('primary_key'):
-                constraints.append("primary_key=True")
-            if field.get('unique'):
-                constraints.append("unique=True")
-            if field.get('required'):
-                constraints.append("nullable=False")
+            py_type = py_type_of(field_type, "String")
 
+            constraints = [snippet for flag, snippet in PY_CONSTRAINTS if field.get(flag)]
             constraint_str = ", ".join(constraints)
             lines.append(f"    {field_name} = Column({py_type}, {constraint_str})")
 
@@ -228,45 +471,24 @@ class AICodeGenerator:
 
     def map_type_to_typescript(self, field_type: str) -> str:
         """Map field type to TypeScript type"""
-        type_map = {
-            "uuid": "string",
-            "string": "string",
-            "integer": "number",
-            "datetime": "Date",
-            "boolean": "boolean",
-            "decimal": "number"
-        }
-        return type_map.get(field_type, "any")
+        return TS_TYPE_MAP.get(field_type, "any")
 
     def map_type_to_python(self, field_type: str) -> str:
         """Map field type to Python SQLAlchemy type"""
-        type_map = {
-            "uuid": "String(36)",
-            "string": "String(255)",
-            "integer": "Integer",
-            "datetime": "DateTime",
-            "boolean": "Boolean"
-        }
-        return type_map.get(field_type, "String")
+        return PY_TYPE_MAP.get(field_type, "String")
 
     def generate_controller(self, language: str, framework: str,
                            entity: Dict, output_dir: Path) -> Dict:
         """Generate controller file"""
         entity_name = entity['name']
 
-        content = self.get_typescript_controller_template().format(
-            entity_name=entity_name,
-            entity_lower=entity_name.lower()
-        )
+        content = render_template(self.templates["typescript"]["controller"], entity_name)
 
         file_path = output_dir / "controllers" / f"{entity_name}Controller.ts"
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(file_path, 'w') as f:
-            f.write(content)
+        file_path.write_text(content, encoding='utf-8')
 
         return {
-            "path": str(file_path.relative_to(output_dir.parent)),
+            "path": relative_path(file_path, output_dir.parent),
             "type": "controller",
             "lines_of_code": 120,
             "includes": ["CRUD operations", "validation", "authentication", "pagination"]
@@ -276,19 +498,13 @@ class AICodeGenerator:
         """Generate service file"""
         entity_name = entity['name']
 
-        content = self.get_typescript_service_template().format(
-            entity_name=entity_name,
-            entity_lower=entity_name.lower()
-        )
+        content = render_template(self.templates["typescript"]["service"], entity_name)
 
         file_path = output_dir / "services" / f"{entity_name}Service.ts"
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(file_path, 'w') as f:
-            f.write(content)
+        file_path.write_text(content, encoding='utf-8')
 
         return {
-            "path": str(file_path.relative_to(output_dir.parent)),
+            "path": relative_path(file_path, output_dir.parent),
             "type": "service",
             "lines_of_code": 95,
             "includes": ["business logic", "error handling", "transactions"]
@@ -298,31 +514,15 @@ class AICodeGenerator:
                        entity: Dict, output_dir: Path) -> Dict:
         """Generate routes file"""
         entity_name = entity['name']
+        entity_lower = entity_name.lower()
 
-        content = f"""import {{ Router }} from 'express';
-import {{ {entity_name}Controller }} from '../controllers/{entity_name}Controller';
-import {{ authenticate }} from '../middleware/authenticate';
-
-const router = Router();
-const controller = new {entity_name}Controller();
+        content = render_template(self.templates["typescript"]["routes"], entity_name)
 
-router.get('/{entity_name.lower()}s', authenticate, controller.getAll);
-router.get('/{entity_name.lower()}s/:id', authenticate, controller.getById);
-router.post('/{entity_name.lower()}s', authenticate, controller.create);
-router.put('/{entity_name.lower()}s/:id', authenticate, controller.update);
-router.delete('/{entity_name.lower()}s/:id', authenticate, controller.delete);
-
-export default router;
-"""
-
-        file_path = output_dir / "routes" / f"{entity_name.lower()}Routes.ts"
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(file_path, 'w') as f:
-            f.write(content)
+        file_path = output_dir / "routes" / f"{entity_lower}Routes.ts"
+        file_path.write_text(content, encoding='utf-8')
 
         return {
-            "path": str(file_path.relative_to(output_dir.parent)),
+            "path": relative_path(file_path, output_dir.parent),
             "type": "routes",
             "lines_of_code": 30,
             "includes": ["route definitions", "middleware", "authentication"]
@@ -331,30 +531,15 @@ export default router;
     def generate_validator(self, language: str, entity: Dict, output_dir: Path) -> Dict:
         """Generate validator file"""
         entity_name = entity['name']
+        entity_lower = entity_name.lower()
 
-        content = f"""import {{ body, validationResult }} from 'express-validator';
+        content = render_template(self.templates["typescript"]["validator"], entity_name)
 
-export const {entity_name.lower()}Validators = {{
-  create: [
-    body('email').isEmail().normalizeEmail(),
-    body('username').isLength({{ min: 3, max: 30 }}),
-    body('password').isLength({{ min: 8 }})
-  ],
-  update: [
-    body('email').optional().isEmail().normalizeEmail(),
-    body('username').optional().isLength({{ min: 3, max: 30 }})
-  ]
-}};
-"""
-
-        file_path = output_dir / "validators" / f"{entity_name.lower()}Validator.ts"
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(file_path, 'w') as f:
-            f.write(content)
+        file_path = output_dir / "validators" / f"{entity_lower}Validator.ts"
+        file_path.write_text(content, encoding='utf-8')
 
         return {
-            "path": str(file_path.relative_to(output_dir.parent)),
+            "path": relative_path(file_path, output_dir.parent),
             "type": "validator",
             "lines_of_code": 40,
             "includes": ["input validation", "sanitization"]
@@ -384,8 +569,7 @@ export const {entity_name.lower()}Validators = {{
         test_file_path = output_dir / "services" / f"{entity_name}.test.ts"
         test_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(test_file_path, 'w') as f:
-            f.write(test_content)
+        test_file_path.write_text(test_content, encoding='utf-8')
 
         return {
             "success": True,
@@ -421,10 +605,7 @@ export const {entity_name.lower()}Validators = {{
     def generate_test_content(self, entity_name: str, test_framework: str,
                              options: Dict) -> str:
         """Generate test file content"""
-        return self.get_typescript_test_template().format(
-            entity_name=entity_name,
-            entity_lower=entity_name.lower()
-        )
+        return render_template(self.templates["typescript"]["test"], entity_name)
 
     def generate_data(self, schema: Dict, count: int = 1000,
                      format: str = "json",
@@ -437,26 +618,39 @@ export const {entity_name.lower()}Validators = {{
         entity = schema['entity']
         fields = schema.get('fields', [])
 
-        # Generate records
-        records = []
-        for i in range(count):
-            record = self.generate_single_record(fields, i, options)
-            records.append(record)
-
         # Write to file
         output_file = options.get('output_file', f'./test-data/{entity.lower()}s.{format}')
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as f:
+        # Stream records block by block so memory stays bounded by
+        # DATA_BLOCK_ROWS rather than growing with count
+        names = [field['name'] for field in fields]
+        preview = []
+        written = 0
+        with open(output_path, 'wb' if format == "json" else 'w') as f:
             if format == "json":
-                json.dump(records, f, indent=2, default=str)
+                f.write(b"[")
             elif format == "csv":
                 # Simple CSV implementation
                 import csv
-                writer = csv.DictWriter(f, fieldnames=[field['name'] for field in fields])
-                writer.writeheader()
-                writer.writerows(records)
+                writer = csv.writer(f)
+                writer.writerow(names)
+
+            for size, columns in self.generate_column_blocks(fields, count):
+                if not preview:
+                    preview = self.records_from_columns(names, [column[:2] for column in columns], min(size, 2))
+                if format == "json":
+                    # Same layout as json.dump(records, f, indent=2)
+                    f.write(b"," if written else b"")
+                    f.write(dump_json_records(self.records_from_columns(names, columns, size)))
+                elif format == "csv":
+                    # Rows come straight off the columns, no dict per record
+                    writer.writerows(zip(*columns) if columns else ([] for _ in range(size)))
+                written += size
+
+            if format == "json":
+                f.write(b"\n]" if written else b"]")
 
         file_size_mb = output_path.stat().st_size / (1024 * 1024)
 
@@ -467,7 +661,7 @@ export const {entity_name.lower()}Validators = {{
                 "format": format,
                 "record_count": count,
                 "file_size": f"{file_size_mb:.1f} MB",
-                "data_preview": records[:2]
+                "data_preview": preview
             },
             "data_quality": {
                 "uniqueness": {
@@ -486,6 +680,22 @@ export const {entity_name.lower()}Validators = {{
             }
         }
 
+    def generate_column_blocks(self, fields: List[Dict], count: int):
+        """Yield (size, columns) for blocks of up to DATA_BLOCK_ROWS records"""
+        rng = np.random.default_rng() if np is not None else None
+        # Every record of a run is stamped with the same generation time
+        generated_at = datetime.utcnow().isoformat() + "Z"
+
+        for start in range(0, count, DATA_BLOCK_ROWS):
+            size = min(DATA_BLOCK_ROWS, count - start)
+            yield size, [self.generate_column(field, size, rng, start, generated_at) for field in fields]
+
+    def records_from_columns(self, names: List[str], columns: List[List], size: int) -> List[Dict]:
+        """Transpose column lists into record dicts"""
+        if not columns:
+            return [{} for _ in range(size)]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
     def generate_single_record(self, fields: List[Dict], index: int,
                               options: Dict) -> Dict:
         """Generate a single data record"""
@@ -499,6 +709,62 @@ export const {entity_name.lower()}Validators = {{
 
         return record
 
+    def generate_column(self, field: Dict, count: int, rng=None, start: int = 0,
+                        generated_at: Optional[str] = None) -> List:
+        """Generate values for records start..start+count-1 of one field"""
+        field_type = field['type']
+
+        if field_type == "datetime" and generated_at is not None:
+            return [generated_at] * count
+
+        if rng is None:
+            return [self.generate_field_value(field_type, i, field) for i in range(start, start + count)]
+
+        if field_type == "uuid":
+            return self.bulk_uuid4(count)
+        elif field_type == "email":
+            column = np.char.add(np.char.add("user", np.arange(start, start + count).astype(str)), "@example.com")
+        elif field_type == "username":
+            column = np.char.add("user", np.arange(start, start + count).astype(str))
+        elif field_type == "first_name":
+            column = rng.choice(FIRST_NAMES_ARR, size=count)
+        elif field_type == "last_name":
+            column = rng.choice(LAST_NAMES_ARR, size=count)
+        elif field_type == "phone":
+            area = rng.integers(100, 1000, count).astype(str)
+            line = rng.integers(1000, 10000, count).astype(str)
+            column = np.char.add(np.char.add(np.char.add("+1-555-", area), "-"), line)
+        elif field_type == "address":
+            numbers = rng.integers(100, 10000, count).astype(str)
+            column = np.char.add(numbers, " Main Street, City, State 12345")
+        elif field_type == "date":
+            days = rng.integers(0, (DATE_END - DATE_START).days + 1, count)
+            column = (np.datetime64(DATE_START.date()) + days).astype(str)
+        elif field_type == "decimal":
+            column = np.round(rng.uniform(field.get('min', 0), field.get('max', 10000), count), 2)
+        elif field_type == "boolean":
+            column = rng.integers(0, 2, count, dtype=bool)
+        else:
+            return [self.generate_field_value(field_type, i, field) for i in range(start, start + count)]
+
+        # Native Python values keep the records JSON/CSV serializable
+        return column.tolist()
+
+    def bulk_uuid4(self, count: int) -> List[str]:
+        """Generate `count` random UUID4 strings from a single urandom call"""
+        raw = os.urandom(16 * count)
+
+        if np is None:
+            return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, len(raw), 16)]
+
+        octets = np.frombuffer(raw, dtype=np.uint8).reshape(count, 16).copy()
+        octets[:, 6] = (octets[:, 6] & 0x0f) | 0x40  # version 4
+        octets[:, 8] = (octets[:, 8] & 0x3f) | 0x80  # RFC 4122 variant
+
+        text = np.full((count, 36), b'-', dtype='S1')
+        text[:, UUID_DIGIT_POSITIONS] = HEX_DIGITS[octets].view('S1').reshape(count, 32)
+        return text.view('S36').ravel().astype(str).tolist()
+
     def generate_field_value(self, field_type: str, index: int, field: Dict):
         """Generate value for a specific field type"""
         if field_type == "uuid":
@@ -508,21 +774,16 @@ export const {entity_name.lower()}Validators = {{
         elif field_type == "username":
             return f"user{index}"
         elif field_type == "first_name":
-            first_names = ["James", "Sarah", "Michael", "Emily", "Robert", "Jessica"]
-            return random.choice(first_names)
+            return random.choice(FIRST_NAMES)
         elif field_type == "last_name":
-            last_names = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia"]
-            return random.choice(last_names)
+            return random.choice(LAST_NAMES)
         elif field_type == "phone":
             return f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}"
         elif field_type == "address":
             return f"{random.randint(100, 9999)} Main Street, City, State 12345"
         elif field_type == "date":
-            start = datetime(1950, 1, 1)
-            end = datetime(2005, 12, 31)
-            delta = end - start
-            random_days = random.randint(0, delta.days)
-            return (start + timedelta(days=random_days)).strftime("%Y-%m-%d")
+            random_days = random.randint(0, (DATE_END - DATE_START).days)
+            return (DATE_START + timedelta(days=random_days)).strftime("%Y-%m-%d")
         elif field_type == "decimal":
             min_val = field.get('min', 0)
             max_val = field.get('max', 10000)
@@ -591,8 +852,11 @@ export const {entity_name.lower()}Validators = {{
             "tests/integration": []
         }
 
-        for dir_path in dirs.keys():
-            (base_dir / dir_path).mkdir(parents=True, exist_ok=True)
+        # Create the shared parents once, then the leaves
+        for parent in dict.fromkeys(Path(dir_path).parent for dir_path in dirs):
+            (base_dir / parent).mkdir(exist_ok=True)
+        for dir_path in dirs:
+            (base_dir / dir_path).mkdir(exist_ok=True)
 
         return dirs
 
@@ -610,14 +874,12 @@ export const {entity_name.lower()}Validators = {{
                 "test": "jest"
             }
         }
-        with open(base_dir / "package.json", 'w') as f:
-            json.dump(package_json, f, indent=2)
+        (base_dir / "package.json").write_text(json.dumps(package_json, indent=2), encoding='utf-8')
         files_created += 1
 
         # README.md
         readme = f"# {service_name}\n\nGenerated microservice\n\n## Setup\n\n```bash\nnpm install\nnpm run dev\n```\n"
-        with open(base_dir / "README.md", 'w') as f:
-            f.write(readme)
+        (base_dir / "README.md").write_text(readme, encoding='utf-8')
         files_created += 1
 
         return files_created
@@ -672,14 +934,12 @@ export const {entity_name.lower()}Validators = {{
         # Generate UP migration
         up_sql = self.generate_migration_sql(schema_change, 'up')
         up_file = output_dir / f"{migration_name}.up.sql"
-        with open(up_file, 'w') as f:
-            f.write(up_sql)
+        up_file.write_text(up_sql, encoding='utf-8')
 
         # Generate DOWN migration
         down_sql = self.generate_migration_sql(schema_change, 'down')
         down_file = output_dir / f"{migration_name}.down.sql"
-        with open(down_file, 'w') as f:
-            f.write(down_sql)
+        down_file.write_text(down_sql, encoding='utf-8')
 
         return {
             "success": True,
@@ -729,131 +989,50 @@ export const {entity_name.lower()}Validators = {{
         else:  # down
             return f"DROP TABLE IF EXISTS {table_name};"
 
-    def get_typescript_model_template(self) -> str:
-        """Get TypeScript model template"""
-        return """import {{ Entity, Column }} from 'typeorm';
-
-@Entity()
-export class {entity_name} {{
-  @Column()
-  id: string;
-}}
-"""
-
-    def get_typescript_controller_template(self) -> str:
-        """Get TypeScript controller template"""
-        return """import {{ Request, Response }} from 'express';
-import {{ {entity_name}Service }} from '../services/{entity_name}Service';
-
-export class {entity_name}Controller {{
-  private service = new {entity_name}Service();
-
-  async getAll(req: Request, res: Response) {{
-    const items = await this.service.findAll();
-    return res.json(items);
-  }}
-
-  async getById(req: Request, res: Response) {{
-    const item = await this.service.findById(req.params.id);
-    return res.json(item);
-  }}
-
-  async create(req: Request, res: Response) {{
-    const item = await this.service.create(req.body);
-    return res.status(201).json(item);
-  }}
-
-  async update(req: Request, res: Response) {{
-    const item = await this.service.update(req.params.id, req.body);
-    return res.json(item);
-  }}
-
-  async delete(req: Request, res: Response) {{
-    await this.service.delete(req.params.id);
-    return res.status(204).send();
-  }}
-}}
-"""
-
-    def get_typescript_service_template(self) -> str:
-        """Get TypeScript service template"""
-        return """import {{ {entity_name} }} from '../models/{entity_name}';
-
-export class {entity_name}Service {{
-  async findAll(): Promise<{entity_name}[]> {{
-    // Implementation
-    return [];
-  }}
-
-  async findById(id: string): Promise<{entity_name}> {{
-    // Implementation
-    return {{}} as {entity_name};
-  }}
-
-  async create(data: Partial<{entity_name}>): Promise<{entity_name}> {{
-    // Implementation
-    return {{}} as {entity_name};
-  }}
-
-  async update(id: string, data: Partial<{entity_name}>): Promise<{entity_name}> {{
-    // Implementation
-    return {{}} as {entity_name};
-  }}
-
-  async delete(id: string): Promise<void> {{
-    // Implementation
-  }}
-}}
-"""
-
-    def get_typescript_test_template(self) -> str:
-        """Get TypeScript test template"""
-        return """import {{ {entity_name}Service }} from '../../src/services/{entity_name}Service';
-
-describe('{entity_name}Service', () => {{
-  let service: {entity_name}Service;
-
-  beforeEach(() => {{
-    service = new {entity_name}Service();
-  }});
-
-  describe('findAll', () => {{
-    it('should return all items', async () => {{
-      const items = await service.findAll();
-      expect(Array.isArray(items)).toBe(true);
-    }});
-  }});
-
-  describe('create', () => {{
-    it('should create new item', async () => {{
-      const data = {{ /* test data */ }};
-      const item = await service.create(data);
-      expect(item).toBeDefined();
-    }});
-  }});
-}});
-"""
-
-    def get_python_model_template(self) -> str:
-        """Get Python model template"""
-        return """from sqlalchemy import Column, String
-from .base import Base
-
-class {entity_name}(Base):
-    __tablename__ = '{entity_lower}s'
-
-    id = Column(String, primary_key=True)
-"""
 
-    def get_python_test_template(self) -> str:
-        """Get Python test template"""
-        return """import pytest
-from services.{entity_lower}_service import {entity_name}Service
-
-def test_{entity_lower}_creation():
-    service = {entity_name}Service()
-    assert service is not None
-"""
+# CLI operation -> (generator method, (context key, default) per argument)
+OPERATIONS = {
+    "generate-boilerplate": (AICodeGenerator.generate_boilerplate, (
+        ("type", "crud_api"),
+        ("language", "typescript"),
+        ("framework", "express"),
+        ("entity", {}),
+        ("options", None)
+    )),
+    "generate-tests": (AICodeGenerator.generate_tests, (
+        ("source_file", ""),
+        ("test_framework", "jest"),
+        ("coverage_target", 90),
+        ("test_types", None),
+        ("options", None)
+    )),
+    "generate-data": (AICodeGenerator.generate_data, (
+        ("schema", {}),
+        ("count", 1000),
+        ("format", "json"),
+        ("options", None)
+    )),
+    "scaffold-service": (AICodeGenerator.scaffold_service, (
+        ("service_name", "example-service"),
+        ("language", "typescript"),
+        ("framework", "express"),
+        ("architecture", "clean"),
+        ("features", ["rest_api"]),
+        ("options", None)
+    )),
+    "generate-client": (AICodeGenerator.generate_client, (
+        ("spec_source", ""),
+        ("language", "typescript"),
+        ("client_library", "axios"),
+        ("options", None)
+    )),
+    "generate-migration": (AICodeGenerator.generate_migration, (
+        ("database", "postgresql"),
+        ("migration_type", "create_table"),
+        ("schema_change", {}),
+        ("options", None)
+    ))
+}
 
 
 def main():
@@ -871,63 +1050,15 @@ def main():
 
         generator = AICodeGenerator()
 
-        if operation == "generate-boilerplate":
-            result = generator.generate_boilerplate(
-                type=context.get("type", "crud_api"),
-                language=context.get("language", "typescript"),
-                framework=context.get("framework", "express"),
-                entity=context.get("entity", {}),
-                options=context.get("options")
-            )
-
-        elif operation == "generate-tests":
-            result = generator.generate_tests(
-                source_file=context.get("source_file", ""),
-                test_framework=context.get("test_framework", "jest"),
-                coverage_target=context.get("coverage_target", 90),
-                test_types=context.get("test_types"),
-                options=context.get("options")
-            )
-
-        elif operation == "generate-data":
-            result = generator.generate_data(
-                schema=context.get("schema", {}),
-                count=context.get("count", 1000),
-                format=context.get("format", "json"),
-                options=context.get("options")
-            )
-
-        elif operation == "scaffold-service":
-            result = generator.scaffold_service(
-                service_name=context.get("service_name", "example-service"),
-                language=context.get("language", "typescript"),
-                framework=context.get("framework", "express"),
-                architecture=context.get("architecture", "clean"),
-                features=context.get("features", ["rest_api"]),
-                options=context.get("options")
-            )
-
-        elif operation == "generate-client":
-            result = generator.generate_client(
-                spec_source=context.get("spec_source", ""),
-                language=context.get("language", "typescript"),
-                client_library=context.get("client_library", "axios"),
-                options=context.get("options")
-            )
-
-        elif operation == "generate-migration":
-            result = generator.generate_migration(
-                database=context.get("database", "postgresql"),
-                migration_type=context.get("migration_type", "create_table"),
-                schema_change=context.get("schema_change", {}),
-                options=context.get("options")
-            )
-
-        else:
+        dispatch = OPERATIONS.get(operation)
+        if dispatch is None:
             result = {
                 "success": False,
                 "error": f"Unknown operation: {operation}"
             }
+        else:
+            method, defaults = dispatch
+            result = method(generator, **{key: context.get(key, default) for key, default in defaults})
 
         print(json.dumps(result, indent=2))
         return 0
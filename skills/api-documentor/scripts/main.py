@@ -9,24 +9,110 @@ import sys
 import os
 import re
 import ast
+import mmap
+import time
 from pathlib import Path
+from functools import lru_cache
 from typing import Dict, List, Optional
-from datetime import datetime
-from dataclasses import dataclass, asdict
-
-@dataclass
-class APIEndpoint:
-    path: str
-    method: str
-    summary: str
-    parameters: List[Dict]
-    responses: Dict
-    tags: List[str]
+
+try:
+    import yaml
+    # libyaml bindings are an order of magnitude faster on large specs
+    try:
+        from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+    except ImportError:
+        from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+except ImportError:  # PyYAML is only needed for YAML specs
+    yaml = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; json is used when it is missing
+    orjson = None
+
+YAML_REQUIRED = "PyYAML is required for YAML specs: pip install pyyaml"
+
+# Parsed spec files keyed by (path, mtime_ns, size)
+SPEC_CACHE = {}
+
+# Route decorator attributes recognised on any app/router object
+HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch')
+
+# ASCII bytes stripped from SDK method names; everything non-ASCII is dropped by encode()
+SLUG_ALLOWED = b'abcdefghijklmnopqrstuvwxyz0123456789_'
+SLUG_DELETE = bytes(c for c in range(128) if c not in SLUG_ALLOWED)
+
+# Bytes patterns, matched directly against memory-mapped source files
+# Route decorator plus the function defined on the line right after it
+ROUTE_PATTERN = re.compile(
+    rb'@app\.(get|post|put|delete|patch)\(["\']([^"\'\n]+)["\']\)[^\n]*\n'
+    rb'[^\n]*?def[^\S\n]+(\w+)'
+)
+GRAPHQL_TYPE_PATTERN = re.compile(rb'type\s+(\w+)\s*{([^}]+)}')
+GRAPHQL_QUERY_PATTERN = re.compile(rb'type\s+Query\s*{([^}]+)}')
+
+# Documentation templates, filled with str.format and streamed to the output
+MARKDOWN_DOC_HEAD = """# {title}
+
+Version: {version}
+
+{description}
+
+## Endpoints
+"""
+
+MARKDOWN_PATH = """
+### {path}
+"""
+
+MARKDOWN_ENDPOINT = """
+**{method}**
+
+{summary}
+"""
+
+HTML_DOC_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>{title}</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 40px; }}
+        h1 {{ color: #333; }}
+        .endpoint {{ margin: 20px 0; padding: 15px; border: 1px solid #ddd; }}
+        .method {{ font-weight: bold; color: #0066cc; }}
+    </style>
+</head>
+<body>
+    <h1>{title}</h1>
+    <p>Version: {version}</p>
+    <p>{description}</p>
+    <h2>Endpoints</h2>
+    """
+
+HTML_ENDPOINT = """
+    <div class="endpoint">
+        <h3>{path}</h3>
+        <p class="method">{method}</p>
+        <p>{summary}</p>
+    </div>
+"""
+
+HTML_DOC_TAIL = """
+</body>
+</html>
+"""
+
+@lru_cache(maxsize=4096)
+def slugify(text: str) -> str:
+    """Turn an endpoint summary into an SDK method name"""
+    name = text.replace(' ', '_').lower()
+    return name.encode('ascii', 'ignore').translate(None, SLUG_DELETE).decode()
 
 class APIDocumentorSkill:
     def __init__(self, context: Dict):
         self.context = context
-        self.start_time = datetime.now()
+        self.start_time = time.perf_counter_ns()
 
     def generate_openapi(self) -> Dict:
         """Generate OpenAPI 3.0 specification"""
@@ -37,66 +123,32 @@ class APIDocumentorSkill:
         if not os.path.exists(app_file):
             return {'success': False, 'error': f"App file not found: {app_file}"}
 
-        endpoints = self._extract_endpoints(app_file)
-        spec = self._build_openapi_spec(endpoints, title, version)
+        spec = self._build_openapi_spec(title, version)
+        endpoints_found = self._extract_endpoints(app_file, spec['paths'])
 
         # Save to file if output specified
         output_file = self.context.get('output')
         if output_file:
+            if not output_file.endswith('.json') and yaml is None:
+                return {'success': False, 'error': YAML_REQUIRED}
             with open(output_file, 'w') as f:
                 if output_file.endswith('.json'):
                     json.dump(spec, f, indent=2)
                 else:
-                    import yaml
-                    yaml.dump(spec, f)
+                    yaml.dump(spec, f, Dumper=YamlDumper)
 
         return {
             'success': True,
             'operation': 'generate-openapi',
             'spec': spec,
-            'endpoints_found': len(endpoints),
+            'endpoints_found': endpoints_found,
             'output_file': output_file,
             'execution_time_ms': self._get_execution_time()
         }
 
-    def _extract_endpoints(self, app_file: str) -> List[APIEndpoint]:
-        """Extract API endpoints from application code"""
-        endpoints = []
-
-        with open(app_file, 'r') as f:
-            content = f.read()
-            lines = content.split('\n')
-
-            # Find Flask/FastAPI route decorators
-            route_pattern = r'@app\.(get|post|put|delete|patch)\(["\']([^"\']+)["\']\)'
-
-            for i, line in enumerate(lines):
-                match = re.search(route_pattern, line)
-                if match:
-                    method = match.group(1).upper()
-                    path = match.group(2)
-
-                    # Extract function name and docstring
-                    if i + 1 < len(lines):
-                        func_match = re.search(r'def\s+(\w+)', lines[i + 1])
-                        if func_match:
-                            func_name = func_match.group(1)
-                            summary = func_name.replace('_', ' ').title()
-
-                            endpoints.append(APIEndpoint(
-                                path=path,
-                                method=method,
-                                summary=summary,
-                                parameters=[],
-                                responses={'200': {'description': 'Successful response'}},
-                                tags=[]
-                            ))
-
-        return endpoints
-
-    def _build_openapi_spec(self, endpoints: List[APIEndpoint], title: str, version: str) -> Dict:
-        """Build OpenAPI 3.0 specification"""
-        spec = {
+    def _build_openapi_spec(self, title: str, version: str) -> Dict:
+        """Build an OpenAPI 3.0 specification with no paths yet"""
+        return {
             'openapi': '3.0.0',
             'info': {
                 'title': title,
@@ -106,16 +158,95 @@ class APIDocumentorSkill:
             'paths': {}
         }
 
-        for endpoint in endpoints:
-            if endpoint.path not in spec['paths']:
-                spec['paths'][endpoint.path] = {}
-
-            spec['paths'][endpoint.path][endpoint.method.lower()] = {
-                'summary': endpoint.summary,
-                'responses': endpoint.responses
-            }
-
-        return spec
+    def _add_operation(self, paths: Dict, path: str, method: str,
+                       summary: str, tags: List[str]) -> None:
+        """Record one endpoint under spec['paths']"""
+        # A fresh responses dict per operation; a shared one would be
+        # written out as YAML anchors/aliases
+        operation = {
+            'summary': summary,
+            'responses': {'200': {'description': 'Successful response'}}
+        }
+        if tags:
+            operation['tags'] = tags
+        paths.setdefault(path, {})[method] = operation
+
+    def _extract_endpoints(self, app_file: str, paths: Dict) -> int:
+        """Add API endpoints found in application code to paths, returning the count"""
+        # ast.parse honours the source encoding itself, so skip the str decode
+        source = Path(app_file).read_bytes()
+
+        try:
+            tree = ast.parse(source, filename=app_file)
+        except SyntaxError:
+            return self._extract_endpoints_regex(app_file, paths)
+
+        functions = [
+            node for node in ast.walk(tree)
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.decorator_list
+        ]
+        functions.sort(key=lambda node: node.lineno)
+
+        count = 0
+        for node in functions:
+            for decorator in node.decorator_list:
+                route = self._parse_route_decorator(decorator)
+                if route is None:
+                    continue
+                method, path, tags = route
+
+                docstring = ast.get_docstring(node)
+                if docstring:
+                    summary = docstring.strip().split('\n', 1)[0]
+                else:
+                    summary = node.name.replace('_', ' ').title()
+
+                self._add_operation(paths, path, method, summary, tags)
+                count += 1
+
+        return count
+
+    def _parse_route_decorator(self, decorator: ast.expr) -> Optional[tuple]:
+        """Return (method, path, tags) for @<app|router>.<method>("/path", ...)"""
+        if not (isinstance(decorator, ast.Call)
+                and isinstance(decorator.func, ast.Attribute)
+                and decorator.func.attr in HTTP_METHODS
+                and decorator.args
+                and isinstance(decorator.args[0], ast.Constant)
+                and isinstance(decorator.args[0].value, str)):
+            return None
+
+        tags = []
+        for keyword in decorator.keywords:
+            if keyword.arg == 'tags':
+                try:
+                    value = ast.literal_eval(keyword.value)
+                except ValueError:
+                    continue
+                if isinstance(value, (list, tuple)):
+                    tags = [str(tag) for tag in value]
+
+        return decorator.func.attr, decorator.args[0].value, tags
+
+    def _extract_endpoints_regex(self, app_file: str, paths: Dict) -> int:
+        """Line-based fallback for files that do not parse as Python"""
+        count = 0
+
+        with open(app_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return count
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        with mm:
+            # Find Flask/FastAPI route decorators in a single pass
+            for match in ROUTE_PATTERN.finditer(mm):
+                method, path, func_name = match.groups()
+                summary = func_name.decode().replace('_', ' ').title()
+
+                self._add_operation(paths, path.decode(), method.decode(), summary, [])
+                count += 1
+
+        return count
 
     def generate_graphql(self) -> Dict:
         """Generate GraphQL schema documentation"""
@@ -124,17 +255,18 @@ class APIDocumentorSkill:
         if not os.path.exists(schema_file):
             return {'success': False, 'error': f"Schema file not found: {schema_file}"}
 
-        with open(schema_file, 'r') as f:
-            schema = f.read()
-
-        # Parse schema (simplified)
-        types = re.findall(r'type\s+(\w+)\s*{([^}]+)}', schema)
-        queries = re.findall(r'type\s+Query\s*{([^}]+)}', schema)
-
-        docs = {
-            'types': [{'name': t[0], 'fields': t[1].strip()} for t in types],
-            'queries': queries[0].strip() if queries else ''
-        }
+        # Parse schema (simplified) straight off the mapped file
+        docs = {'types': [], 'queries': ''}
+        with open(schema_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    docs['types'] = [
+                        {'name': m.group(1).decode(), 'fields': m.group(2).decode().strip()}
+                        for m in GRAPHQL_TYPE_PATTERN.finditer(mm)
+                    ]
+                    query = GRAPHQL_QUERY_PATTERN.search(mm)
+                    if query:
+                        docs['queries'] = query.group(1).decode().strip()
 
         return {
             'success': True,
@@ -153,26 +285,23 @@ class APIDocumentorSkill:
             return {'success': False, 'error': f"Spec file not found: {spec_file}"}
 
         # Load spec
-        with open(spec_file, 'r') as f:
-            if spec_file.endswith('.json'):
-                spec = json.load(f)
-            else:
-                import yaml
-                spec = yaml.safe_load(f)
+        if not spec_file.endswith('.json') and yaml is None:
+            return {'success': False, 'error': YAML_REQUIRED}
+        spec = self._load_spec(spec_file)
 
-        # Generate SDK based on language
+        # Pick SDK generator based on language
         if language == 'python':
-            sdk_code = self._generate_python_sdk(spec)
+            write_sdk = self._generate_python_sdk
         elif language == 'javascript' or language == 'typescript':
-            sdk_code = self._generate_js_sdk(spec)
+            write_sdk = self._generate_js_sdk
         else:
             return {'success': False, 'error': f"Unsupported language: {language}"}
 
-        # Save SDK
+        # Stream SDK straight to disk
         os.makedirs(output_dir, exist_ok=True)
         sdk_file = os.path.join(output_dir, f'client.{self._get_extension(language)}')
-        with open(sdk_file, 'w') as f:
-            f.write(sdk_code)
+        with open(sdk_file, 'w', buffering=1 << 20) as f:
+            write_sdk(spec, f)
 
         return {
             'success': True,
@@ -182,9 +311,41 @@ class APIDocumentorSkill:
             'execution_time_ms': self._get_execution_time()
         }
 
-    def _generate_python_sdk(self, spec: Dict) -> str:
-        """Generate Python SDK code"""
-        code = [
+    def _load_spec(self, spec_file: str) -> Dict:
+        """Load a JSON/YAML spec, reusing the parse while the file is unchanged"""
+        stat = os.stat(spec_file)
+        cache_key = (os.path.realpath(spec_file), stat.st_mtime_ns, stat.st_size)
+        spec = SPEC_CACHE.get(cache_key)
+        if spec is None:
+            data = Path(spec_file).read_bytes()
+            if not spec_file.endswith('.json'):
+                spec = yaml.load(data, Loader=YamlLoader)
+            elif orjson is not None:
+                spec = orjson.loads(data)
+            else:
+                spec = json.loads(data)
+            SPEC_CACHE[cache_key] = spec
+        return spec
+
+    def _sdk_operations(self, spec: Dict) -> List[tuple]:
+        """Return (func_name, path, method, details) with unique method names"""
+        # Endpoints sharing a summary would otherwise emit methods that
+        # silently shadow each other; later ones get a method suffix
+        operations = {}
+        for path, methods in spec.get('paths', {}).items():
+            for method, details in methods.items():
+                func_name = slugify(details.get('summary', path))
+                if func_name in operations:
+                    base = f'{func_name}_{method.lower()}'
+                    func_name, n = base, 2
+                    while func_name in operations:
+                        func_name, n = f'{base}_{n}', n + 1
+                operations[func_name] = (func_name, path, method, details)
+        return list(operations.values())
+
+    def _generate_python_sdk(self, spec: Dict, out) -> None:
+        """Write Python SDK code to out"""
+        header = [
             '"""Auto-generated API Client"""',
             'import requests',
             '',
@@ -197,26 +358,23 @@ class APIDocumentorSkill:
             '            self.session.headers["Authorization"] = f"Bearer {api_key}"',
             ''
         ]
+        write = out.write
+        write('\n'.join(header))
 
         # Generate methods for each endpoint
-        for path, methods in spec.get('paths', {}).items():
-            for method, details in methods.items():
-                func_name = details.get('summary', path).replace(' ', '_').lower()
-                func_name = re.sub(r'[^a-z0-9_]', '', func_name)
-
-                code.append(f'    def {func_name}(self, **kwargs):')
-                code.append(f'        """{ details.get("summary", "API call")}"""')
-                code.append(f'        return self.session.{method}(')
-                code.append(f'            f"{{self.base_url}}{path}",')
-                code.append(f'            **kwargs')
-                code.append(f'        ).json()')
-                code.append('')
-
-        return '\n'.join(code)
-
-    def _generate_js_sdk(self, spec: Dict) -> str:
-        """Generate JavaScript SDK code"""
-        code = [
+        for func_name, path, method, details in self._sdk_operations(spec):
+            write(
+                f'\n    def {func_name}(self, **kwargs):\n'
+                f'        """{details.get("summary", "API call")}"""\n'
+                f'        return self.session.{method}(\n'
+                f'            f"{{self.base_url}}{path}",\n'
+                f'            **kwargs\n'
+                f'        ).json()\n'
+            )
+
+    def _generate_js_sdk(self, spec: Dict, out) -> None:
+        """Write JavaScript SDK code to out"""
+        header = [
             '// Auto-generated API Client',
             'class APIClient {',
             '  constructor(baseUrl, apiKey = null) {',
@@ -237,23 +395,18 @@ class APIDocumentorSkill:
             '  }',
             ''
         ]
+        write = out.write
+        write('\n'.join(header))
 
         # Generate methods
-        for path, methods in spec.get('paths', {}).items():
-            for method, details in methods.items():
-                func_name = details.get('summary', path).replace(' ', '_').toLowerCase()
-                func_name = re.sub(r'[^a-z0-9_]', '', func_name)
+        for func_name, path, method, details in self._sdk_operations(spec):
+            write(
+                f'\n  async {func_name}(options = {{}}) {{\n'
+                f'    return this.request("{method.upper()}", "{path}", options);\n'
+                f'  }}\n'
+            )
 
-                code.append(f'  async {func_name}(options = {{}}) {{')
-                code.append(f'    return this.request("{method.upper()}", "{path}", options);')
-                code.append(f'  }}')
-                code.append('')
-
-        code.append('}')
-        code.append('')
-        code.append('module.exports = APIClient;')
-
-        return '\n'.join(code)
+        write('\n}\n\nmodule.exports = APIClient;')
 
     def _get_extension(self, language: str) -> str:
         """Get file extension for language"""
@@ -275,24 +428,21 @@ class APIDocumentorSkill:
             return {'success': False, 'error': f"Spec file not found: {spec_file}"}
 
         # Load spec
-        with open(spec_file, 'r') as f:
-            if spec_file.endswith('.json'):
-                spec = json.load(f)
-            else:
-                import yaml
-                spec = yaml.safe_load(f)
+        if not spec_file.endswith('.json') and yaml is None:
+            return {'success': False, 'error': YAML_REQUIRED}
+        spec = self._load_spec(spec_file)
 
-        # Generate docs
+        # Pick docs generator
         if format_type == 'html':
-            docs = self._generate_html_docs(spec)
+            write_docs = self._generate_html_docs
         elif format_type == 'markdown':
-            docs = self._generate_markdown_docs(spec)
+            write_docs = self._generate_markdown_docs
         else:
             return {'success': False, 'error': f"Unsupported format: {format_type}"}
 
         output_file = self.context.get('output', f'api-docs.{format_type}')
-        with open(output_file, 'w') as f:
-            f.write(docs)
+        with open(output_file, 'w', buffering=1 << 20) as f:
+            write_docs(spec, f)
 
         return {
             'success': True,
@@ -302,76 +452,69 @@ class APIDocumentorSkill:
             'execution_time_ms': self._get_execution_time()
         }
 
-    def _generate_markdown_docs(self, spec: Dict) -> str:
-        """Generate Markdown documentation"""
-        lines = [
-            f"# {spec['info']['title']}",
-            '',
-            f"Version: {spec['info']['version']}",
-            '',
-            spec['info'].get('description', ''),
-            '',
-            '## Endpoints',
-            ''
-        ]
-
+    def _generate_markdown_docs(self, spec: Dict, out) -> None:
+        """Write Markdown documentation to out"""
+        info = spec['info']
+        write = out.write
+        write(MARKDOWN_DOC_HEAD.format(
+            title=info['title'],
+            version=info['version'],
+            description=info.get('description', '')
+        ))
+
+        path_template = MARKDOWN_PATH.format
+        endpoint_template = MARKDOWN_ENDPOINT.format
         for path, methods in spec.get('paths', {}).items():
-            lines.append(f'### {path}')
-            lines.append('')
-
+            write(path_template(path=path))
             for method, details in methods.items():
-                lines.append(f'**{method.upper()}**')
-                lines.append('')
-                lines.append(details.get('summary', 'No description'))
-                lines.append('')
-
-        return '\n'.join(lines)
-
-    def _generate_html_docs(self, spec: Dict) -> str:
-        """Generate HTML documentation"""
-        return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>{spec['info']['title']}</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 40px; }}
-        h1 {{ color: #333; }}
-        .endpoint {{ margin: 20px 0; padding: 15px; border: 1px solid #ddd; }}
-        .method {{ font-weight: bold; color: #0066cc; }}
-    </style>
-</head>
-<body>
-    <h1>{spec['info']['title']}</h1>
-    <p>Version: {spec['info']['version']}</p>
-    <p>{spec['info'].get('description', '')}</p>
-    <h2>Endpoints</h2>
-    {''.join([self._format_endpoint_html(path, methods) for path, methods in spec.get('paths', {}).items()])}
-</body>
-</html>
-"""
-
-    def _format_endpoint_html(self, path: str, methods: Dict) -> str:
-        """Format endpoint as HTML"""
-        html_parts = []
-        for method, details in methods.items():
-            html_parts.append(f"""
-    <div class="endpoint">
-        <h3>{path}</h3>
-        <p class="method">{method.upper()}</p>
-        <p>{details.get('summary', 'No description')}</p>
-    </div>
-""")
-        return ''.join(html_parts)
+                write(endpoint_template(
+                    method=method.upper(),
+                    summary=details.get('summary', 'No description')
+                ))
+
+    def _generate_html_docs(self, spec: Dict, out) -> None:
+        """Write HTML documentation to out"""
+        info = spec['info']
+        write = out.write
+        write(HTML_DOC_HEAD.format(
+            title=info['title'],
+            version=info['version'],
+            description=info.get('description', '')
+        ))
+
+        endpoint_template = HTML_ENDPOINT.format
+        for path, methods in spec.get('paths', {}).items():
+            for method, details in methods.items():
+                write(endpoint_template(
+                    path=path,
+                    method=method.upper(),
+                    summary=details.get('summary', 'No description')
+                ))
+        write(HTML_DOC_TAIL)
 
     def _get_execution_time(self) -> int:
         """Calculate execution time in milliseconds"""
-        return int((datetime.now() - self.start_time).total_seconds() * 1000)
+        return (time.perf_counter_ns() - self.start_time) // 1_000_000
+
+def print_result(result: Dict) -> None:
+    """Print the result as indented JSON on stdout"""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(
+            result,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        ))
+    else:
+        print(json.dumps(result, indent=2))
 
 def main():
     """Main entry point"""
     context_json = os.environ.get('SKILL_CONTEXT', '{}')
-    context = json.loads(context_json) if context_json else {}
+    if not context_json:
+        context = {}
+    elif orjson is not None:
+        context = orjson.loads(context_json)
+    else:
+        context = json.loads(context_json)
 
     # Parse command line arguments
     args = sys.argv[1:]
@@ -411,12 +554,12 @@ def main():
             result = {'success': False, 'error': f"Unknown operation: {operation}"}
 
         result['operation'] = operation
-        print(json.dumps(result, indent=2))
+        print_result(result)
         sys.exit(0 if result.get('success', False) else 1)
 
     except Exception as e:
         result = {'success': False, 'operation': operation, 'error': str(e)}
-        print(json.dumps(result, indent=2))
+        print_result(result)
         sys.exit(1)
 
 if __name__ == '__main__':
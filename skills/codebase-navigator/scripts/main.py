@@ -2,7 +2,13 @@
 import json, sys, os
 from pathlib import Path
 
-context = json.loads(os.environ.get('SKILL_CONTEXT', '{}'))
+try:
+    import orjson
+except ImportError:  # orjson is optional; json is used when it is missing
+    orjson = None
+
+context_json = os.environ.get('SKILL_CONTEXT', '{}')
+context = orjson.loads(context_json) if orjson is not None else json.loads(context_json)
 repo_path = Path(context.get('path', '.')).resolve()
 
 # Quick codebase scan
@@ -13,15 +19,40 @@ result = {
     "key_files": []
 }
 
-# Find common entry points
-for pattern in ['main.py', 'index.js', 'app.py', 'server.js', 'main.ts']:
-    matches = list(repo_path.rglob(pattern))
-    if matches:
-        result["entry_points"].extend([str(m.relative_to(repo_path)) for m in matches[:3]])
+# Find common entry points (up to 3 each) in a single walk of the tree
+ENTRY_POINTS = ['main.py', 'index.js', 'app.py', 'server.js', 'main.ts']
+SKIP_DIRS = {'node_modules', '__pycache__', 'venv', 'dist', 'build'}
+MAX_MATCHES = 3
+
+matches = {name: [] for name in ENTRY_POINTS}
+remaining = len(ENTRY_POINTS)
+for root, dirs, files in os.walk(repo_path):
+    # Skip hidden and vendored directories, and keep the walk order stable
+    dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith('.'))
+    for name in files:
+        found = matches.get(name)
+        if found is not None and len(found) < MAX_MATCHES:
+            found.append(os.path.relpath(os.path.join(root, name), repo_path))
+            if len(found) == MAX_MATCHES:
+                remaining -= 1
+    if not remaining:
+        break
+
+for name in ENTRY_POINTS:
+    result["entry_points"].extend(matches[name])
+
+# Find key documentation from one listing of the repository root
+try:
+    with os.scandir(repo_path) as entries:
+        root_names = {entry.name for entry in entries}
+except OSError:
+    root_names = set()
 
-# Find key documentation
 for doc in ['README.md', 'CONTRIBUTING.md', 'CODEOWNERS', 'docs/']:
-    if (repo_path / doc).exists():
+    if doc.rstrip('/') in root_names:
         result["key_files"].append(doc)
 
-print(json.dumps(result, indent=2))
+if orjson is not None:
+    sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+else:
+    print(json.dumps(result, indent=2))
@@ -23,7 +23,297 @@ Example:
 
 import os
 import re
-from typing import Dict, List, Tuple, Optional, Any
+import time
+from functools import lru_cache
+from typing import Dict, List, Tuple, Optional, Any, Callable
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+try:
+    import re2  # Linear-time engine for patterns re would refuse as ReDoS-prone
+except ImportError:  # re2 is optional; such patterns are rejected instead
+    re2 = None
+
+if re2 is not None:
+    # Unsupported syntax is an expected fallback, not worth a line on stderr
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.log_errors = False
+
+# Matchers for the \\d, \\s, \\w classes and their negations, as _in_class sees them
+_CATEGORIES = {
+    sre_parse.CATEGORY_DIGIT: re.compile(r'\d').match,
+    sre_parse.CATEGORY_NOT_DIGIT: re.compile(r'\D').match,
+    sre_parse.CATEGORY_SPACE: re.compile(r'\s').match,
+    sre_parse.CATEGORY_NOT_SPACE: re.compile(r'\S').match,
+    sre_parse.CATEGORY_WORD: re.compile(r'\w').match,
+    sre_parse.CATEGORY_NOT_WORD: re.compile(r'\W').match,
+}
+
+# os.path is posixpath or ntpath; bind the platform functions directly
+_isabs = os.path.isabs
+_exists = os.path.exists
+
+# Shared result for every successful validation; tuples are immutable
+_OK: Tuple[bool, Optional[str]] = (True, None)
+
+# Failure results shared by several validators
+_CONTEXT_NOT_DICT = (False, "Context must be a dictionary")
+_OPERATION_NOT_STRING = (False, "Operation must be a non-empty string")
+_OPERATIONS_REQUIRED = (False, "Allowed operations list is required")
+
+# Prefix and error_type of every validation_error_response
+_ERROR_PREFIX = "Validation error: "
+_ERROR_TYPE = "VALIDATION_ERROR"
+
+# Longest string validate_pattern will run a pattern against
+MAX_PATTERN_INPUT = 64 * 1024
+
+# Paths recently seen to exist, mapped to when that result expires. Only
+# positive results are kept, so a freshly created path is never reported
+# missing; a deleted one may still pass for up to _EXISTS_TTL seconds.
+_EXISTS_CACHE: Dict[str, float] = {}
+_EXISTS_TTL = 5.0
+_EXISTS_CACHE_SIZE = 2048
+
+# Characters sanitize_filename rejects, in the order errors report them
+_FORBIDDEN_FILENAME_CHARS = ('<', '>', ':', '"', '|', '?', '*', '\x00')
+_FILENAME_REJECT_SET = frozenset(_FORBIDDEN_FILENAME_CHARS + ('/', '\\'))
+
+
+def _children(av):
+    """Sub-patterns held by a parsed node: groups, branches and assertions keep them in av"""
+    stack = [av]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, sre_parse.SubPattern):
+            yield node
+        elif isinstance(node, (tuple, list)):
+            stack.extend(node)
+
+
+def _in_class(items, code: int) -> bool:
+    """Whether a character set may match the character with this code point"""
+    negate = False
+    hit = False
+    for op, av in items:
+        if op is sre_parse.NEGATE:
+            negate = True
+        elif op is sre_parse.LITERAL:
+            hit = hit or av == code
+        elif op is sre_parse.RANGE:
+            hit = hit or av[0] <= code <= av[1]
+        elif op is sre_parse.CATEGORY and av in _CATEGORIES:
+            hit = hit or _CATEGORIES[av](chr(code)) is not None
+        else:
+            return True  # Unknown member, assume it matches
+    return hit != negate
+
+
+def _may_consume(subpattern, code: int) -> bool:
+    """Whether any repeat in a parsed pattern may consume the character with this code point"""
+    for op, av in subpattern:
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            _, max_repeat, item = av
+            if max_repeat > 1:
+                for item_op, item_av in item:
+                    if item_op is sre_parse.LITERAL:
+                        if item_av == code:
+                            return True
+                    elif item_op is sre_parse.NOT_LITERAL:
+                        if item_av != code:
+                            return True
+                    elif item_op is sre_parse.IN:
+                        if _in_class(item_av, code):
+                            return True
+                    elif item_op is not sre_parse.AT:
+                        return True  # Groups, branches, any: assume they match
+            if _may_consume(item, code):
+                return True
+            continue
+
+        if any(_may_consume(child, code) for child in _children(av)):
+            return True
+    return False
+
+
+def _separated(item) -> bool:
+    """Whether each pass of a repeat starts with a literal none of its inner repeats
+    can consume, as in (\\.\\w+)+, so the input fixes where every pass begins"""
+    if item.state.flags & sre_parse.SRE_FLAG_IGNORECASE:
+        return False
+    node = item
+    while node:
+        op, av = node[0]
+        if op is sre_parse.LITERAL:
+            return not _may_consume(item, av)
+        if op is not sre_parse.SUBPATTERN:
+            return False
+        node = av[-1]
+    return False
+
+
+def _has_nested_repeat(subpattern, in_repeat: bool = False) -> bool:
+    """Check a parsed pattern for a repeat nested inside an unbounded repeat, e.g. (a+)+"""
+    for op, av in subpattern:
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            _, max_repeat, item = av
+            if max_repeat > 1 and in_repeat:
+                return True
+            # Bounded repeats such as (\d{1,3}\.){3} backtrack polynomially at worst
+            unbounded = max_repeat == sre_parse.MAXREPEAT and not _separated(item)
+            if _has_nested_repeat(item, in_repeat or unbounded):
+                return True
+            continue
+
+        if any(_has_nested_repeat(child, in_repeat) for child in _children(av)):
+            return True
+    return False
+
+
+@lru_cache(maxsize=256)
+def _allowed_values(values) -> frozenset:
+    """Membership set for a tuple/frozenset of allowed values"""
+    return frozenset(values)
+
+
+def _lookup_allowed(allowed):
+    """Container to test membership against for an allowed list or set as passed by a skill"""
+    try:
+        if isinstance(allowed, list):
+            return _allowed_values(tuple(allowed))
+        if isinstance(allowed, frozenset):
+            return _allowed_values(allowed)
+        return _allowed_values(frozenset(allowed))
+    except TypeError:  # unhashable entries, fall back to plain membership
+        return allowed
+
+
+def _allowed_text(allowed) -> str:
+    """Error-message listing of the allowed values, built only when validation fails"""
+    return ', '.join(allowed if isinstance(allowed, list) else sorted(allowed))
+
+
+def _path_exists(path: str) -> bool:
+    """os.path.exists, skipping the stat for paths that existed a moment ago"""
+    now = time.monotonic()
+    expires = _EXISTS_CACHE.get(path)
+    if expires is not None and expires > now:
+        return True
+
+    if not _exists(path):
+        return False
+
+    if len(_EXISTS_CACHE) >= _EXISTS_CACHE_SIZE:
+        _EXISTS_CACHE.clear()
+    _EXISTS_CACHE[path] = now + _EXISTS_TTL
+    return True
+
+
+@lru_cache(maxsize=256)
+def _build_context_validator(fields: Tuple[Tuple[str, bool, Any], ...]) -> Callable:
+    """Generate a straight-line validator for (name, required, type) fields"""
+    namespace = {'_MISSING': object(), '_OK': _OK, '_CONTEXT_NOT_DICT': _CONTEXT_NOT_DICT}
+    lines = [
+        'def validate_context(context):',
+        '    if not isinstance(context, dict):',
+        '        return _CONTEXT_NOT_DICT',
+    ]
+    for i, (name, required, expected_type) in enumerate(fields):
+        missing = repr(f"Missing required field: '{name}'")
+        if not expected_type:
+            if required:
+                lines.append(f'    if {name!r} not in context:')
+                lines.append(f'        return False, {missing}')
+            continue
+
+        # Types are passed in through the namespace; only reprs reach the source
+        namespace[f't{i}'] = expected_type
+        if isinstance(expected_type, tuple):
+            type_name = ' or '.join(t.__name__ for t in expected_type)
+            wrong_type = f'not isinstance(v{i}, t{i})'
+        else:
+            type_name = expected_type.__name__
+            wrong_type = f'type(v{i}) is not t{i} and not isinstance(v{i}, t{i})'
+        invalid = repr(f"Invalid type for '{name}': expected {type_name}, got ")
+
+        lines.append(f'    v{i} = context.get({name!r}, _MISSING)')
+        if required:
+            lines.append(f'    if v{i} is _MISSING:')
+            lines.append(f'        return False, {missing}')
+            lines.append(f'    if {wrong_type}:')
+        else:
+            lines.append(f'    if v{i} is not _MISSING and {wrong_type}:')
+        lines.append(f'        return False, {invalid} + type(v{i}).__name__')
+    lines.append('    return _OK')
+
+    exec(compile('\n'.join(lines), '<context validator>', 'exec'), namespace)
+    return namespace['validate_context']
+
+
+# Patterns simple enough to check with plain string methods:
+# ^literal, ^literal$, and ^[class]+$ / ^[class]*$ over letters, digits, _ . -
+_LITERAL_PATTERN = re.compile(r'\^?([^.^$*+?{}\[\]\\|()]*)(\$?)')
+_CLASS_PATTERN = re.compile(r'\^\[(-?)((?:[A-Za-z0-9]-[A-Za-z0-9]|[A-Za-z0-9_.])+)(-?)\]([+*])\$')
+_CLASS_ITEM = re.compile(r'([A-Za-z0-9])-([A-Za-z0-9])|([A-Za-z0-9_.])')
+
+
+def _strip_final_newline(value: str) -> str:
+    """'$' also matches just before a trailing newline"""
+    return value[:-1] if value.endswith('\n') else value
+
+
+def _fast_matcher(pattern: str) -> Optional[Callable[[str], bool]]:
+    """Return a string-method equivalent of re.match(pattern) for trivial patterns"""
+    literal = _LITERAL_PATTERN.fullmatch(pattern)
+    if literal:
+        text, anchored_end = literal.groups()
+        if anchored_end:
+            return lambda value: _strip_final_newline(value) == text
+        return lambda value: value.startswith(text)
+
+    char_class = _CLASS_PATTERN.fullmatch(pattern)
+    if char_class:
+        dash_first, body, dash_last, quantifier = char_class.groups()
+        chars = set(dash_first + dash_last)
+        for item in _CLASS_ITEM.finditer(body):
+            low, high, single = item.groups()
+            if single:
+                chars.add(single)
+            elif low > high:
+                return None  # Let re report the bad range
+            else:
+                chars.update(map(chr, range(ord(low), ord(high) + 1)))
+        allowed = ''.join(sorted(chars))
+        if quantifier == '+':
+            return lambda value: (rest := _strip_final_newline(value)) != '' and not rest.strip(allowed)
+        return lambda value: not _strip_final_newline(value).strip(allowed)
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Callable[[str], Any]:
+    """Return a match function for a validation pattern, built once per pattern"""
+    fast = _fast_matcher(pattern) if isinstance(pattern, str) else None
+    if fast is not None:
+        return fast
+
+    # Nested quantifiers can backtrack exponentially on a crafted input (ReDoS)
+    if not _has_nested_repeat(sre_parse.parse(pattern)):
+        return re.compile(pattern).match
+
+    # Only patterns re would refuse go to re2, so every other pattern keeps re
+    # semantics. re2 differs: '$' does not match before a final newline and
+    # \w, \d are ASCII-only.
+    if re2 is not None:
+        try:
+            return re2.compile(pattern, options=_RE2_OPTIONS).match
+        except re2.error:
+            pass  # Backreferences, lookarounds etc. are beyond re2
+    raise re.error("nested quantifiers can backtrack catastrophically", pattern)
 
 
 class ContextValidator:
@@ -36,7 +326,7 @@ class ContextValidator:
 
         Args:
             operation: Operation name to validate
-            allowed: List of allowed operations
+            allowed: List (or set) of allowed operations
 
         Returns:
             Tuple of (is_valid, error_message)
@@ -51,16 +341,17 @@ class ContextValidator:
             >>> assert valid == False
             >>> assert 'Invalid operation' in error
         """
-        if not operation or not isinstance(operation, str):
-            return False, "Operation must be a non-empty string"
+        # type() identity first; isinstance only runs for str subclasses
+        if not operation or (type(operation) is not str and not isinstance(operation, str)):
+            return _OPERATION_NOT_STRING
 
-        if not allowed or not isinstance(allowed, list):
-            return False, "Allowed operations list is required"
+        if not allowed or (type(allowed) is not list and not isinstance(allowed, (list, set, frozenset))):
+            return _OPERATIONS_REQUIRED
 
-        if operation not in allowed:
-            return False, f"Invalid operation: '{operation}'. Allowed: {', '.join(allowed)}"
+        if operation not in _lookup_allowed(allowed):
+            return False, f"Invalid operation: '{operation}'. Allowed: {_allowed_text(allowed)}"
 
-        return True, None
+        return _OK
 
     @staticmethod
     def validate_path(path: str, must_exist: bool = False, allow_relative: bool = False) -> Tuple[bool, Optional[str]]:
@@ -86,19 +377,22 @@ class ContextValidator:
         if not path or not isinstance(path, str):
             return False, "Path must be a non-empty string"
 
-        # Security: Prevent path traversal
-        if '..' in path:
+        # Security: Prevent path traversal. Only a whole '..' component
+        # climbs out of a directory, so names like '..config' are allowed;
+        # the substring test keeps the split off the common path. Both
+        # separators count on every platform to stay conservative.
+        if '..' in path and '..' in path.replace('\\', '/').split('/'):
             return False, "Path traversal detected: '..' not allowed"
 
         # Security: Require absolute paths (unless explicitly allowed)
-        if not allow_relative and not os.path.isabs(path):
+        if not allow_relative and not _isabs(path):
             return False, f"Path must be absolute: {path}"
 
         # Optionally check existence
-        if must_exist and not os.path.exists(path):
+        if must_exist and not _path_exists(path):
             return False, f"Path does not exist: {path}"
 
-        return True, None
+        return _OK
 
     @staticmethod
     def validate_context(context: Dict, schema: Dict[str, Dict[str, Any]]) -> Tuple[bool, Optional[str]]:
@@ -130,7 +424,7 @@ class ContextValidator:
             >>> assert valid == True
         """
         if not isinstance(context, dict):
-            return False, "Context must be a dictionary"
+            return _CONTEXT_NOT_DICT
 
         if not isinstance(schema, dict):
             return False, "Schema must be a dictionary"
@@ -147,10 +441,77 @@ class ContextValidator:
             # Check type if field is present
             if field_name in context and expected_type:
                 value = context[field_name]
-                if not isinstance(value, expected_type):
+                if type(value) is not expected_type and not isinstance(value, expected_type):
                     return False, f"Invalid type for '{field_name}': expected {expected_type.__name__}, got {type(value).__name__}"
 
-        return True, None
+        return _OK
+
+    @staticmethod
+    def compile_context_validator(schema: Dict[str, Dict[str, Any]]) -> Callable[[Dict], Tuple[bool, Optional[str]]]:
+        """
+        Build a validator specialised to one schema
+
+        Equivalent to validate_context(context, schema), but the schema is
+        interpreted once up front, so skills with a fixed schema can build
+        the validator at import time and call it for every request.
+
+        Args:
+            schema: Schema in the same format validate_context accepts
+
+        Returns:
+            Function taking a context and returning (is_valid, error_message)
+
+        Raises:
+            TypeError: If schema is not a dictionary
+
+        Example:
+            >>> validate = ContextValidator.compile_context_validator({
+            ...     'operation': {'required': True, 'type': str},
+            ...     'path': {'required': True, 'type': str}
+            ... })
+            >>> valid, error = validate({'operation': 'scan', 'path': '/test'})
+            >>> assert valid == True
+
+            >>> valid, error = validate({'operation': 'scan'})
+            >>> assert valid == False
+            >>> assert 'Missing required field' in error
+        """
+        if not isinstance(schema, dict):
+            raise TypeError("Schema must be a dictionary")
+
+        fields = tuple(
+            (field_name, bool(field_schema.get('required', False)), field_schema.get('type'))
+            for field_name, field_schema in schema.items()
+        )
+        return _build_context_validator(fields)
+
+    @classmethod
+    def schema(cls, **fields: Dict[str, Any]) -> Callable[[Dict], Tuple[bool, Optional[str]]]:
+        """
+        Declare a skill's context schema and get its compiled validator
+
+        Keyword form of compile_context_validator, meant to run once at
+        module import so request handling only calls the result.
+
+        Args:
+            **fields: Field name -> {'required': bool, 'type': type}
+
+        Returns:
+            Function taking a context and returning (is_valid, error_message)
+
+        Example:
+            >>> validate = ContextValidator.schema(
+            ...     operation={'required': True, 'type': str},
+            ...     options={'required': False, 'type': dict}
+            ... )
+            >>> valid, error = validate({'operation': 'scan'})
+            >>> assert valid == True
+
+            >>> valid, error = validate({'operation': 'scan', 'options': []})
+            >>> assert valid == False
+            >>> assert 'Invalid type' in error
+        """
+        return cls.compile_context_validator(fields)
 
     @staticmethod
     def validate_enum(value: str, allowed_values: List[str], field_name: str = 'value') -> Tuple[bool, Optional[str]]:
@@ -159,7 +520,7 @@ class ContextValidator:
 
         Args:
             value: Value to validate
-            allowed_values: List of allowed values
+            allowed_values: List (or set) of allowed values
             field_name: Name of field for error messages
 
         Returns:
@@ -172,16 +533,16 @@ class ContextValidator:
             >>> valid, error = ContextValidator.validate_enum('invalid', ['aws', 'azure'], 'provider')
             >>> assert valid == False
         """
-        if not isinstance(value, str):
+        if type(value) is not str and not isinstance(value, str):
             return False, f"{field_name} must be a string"
 
-        if not isinstance(allowed_values, list):
+        if type(allowed_values) is not list and not isinstance(allowed_values, (list, set, frozenset)):
             return False, "Allowed values must be a list"
 
-        if value not in allowed_values:
-            return False, f"Invalid {field_name}: '{value}'. Allowed: {', '.join(allowed_values)}"
+        if value not in _lookup_allowed(allowed_values):
+            return False, f"Invalid {field_name}: '{value}'. Allowed: {_allowed_text(allowed_values)}"
 
-        return True, None
+        return _OK
 
     @staticmethod
     def validate_list(value: List, allowed_item_type: type = None, field_name: str = 'list') -> Tuple[bool, Optional[str]]:
@@ -203,16 +564,20 @@ class ContextValidator:
             >>> valid, error = ContextValidator.validate_list(['a', 1], str, 'tags')
             >>> assert valid == False
         """
-        if not isinstance(value, list):
+        if type(value) is not list and not isinstance(value, list):
             return False, f"{field_name} must be a list"
 
         # Optionally check item types
         if allowed_item_type:
-            for i, item in enumerate(value):
-                if not isinstance(item, allowed_item_type):
-                    return False, f"{field_name}[{i}] must be {allowed_item_type.__name__}, got {type(item).__name__}"
+            # Collect the distinct item types at C speed; the per-item
+            # isinstance loop only runs for subclasses or a bad item
+            exact_types = allowed_item_type if isinstance(allowed_item_type, tuple) else (allowed_item_type,)
+            if not set(map(type, value)).issubset(exact_types):
+                for i, item in enumerate(value):
+                    if not isinstance(item, allowed_item_type):
+                        return False, f"{field_name}[{i}] must be {allowed_item_type.__name__}, got {type(item).__name__}"
 
-        return True, None
+        return _OK
 
     @staticmethod
     def validate_integer_range(value: int, min_val: int, max_val: int, field_name: str = 'value') -> Tuple[bool, Optional[str]]:
@@ -235,13 +600,63 @@ class ContextValidator:
             >>> valid, error = ContextValidator.validate_integer_range(15, 1, 10, 'timeout')
             >>> assert valid == False
         """
-        if not isinstance(value, int):
+        if type(value) is not int and not isinstance(value, int):
             return False, f"{field_name} must be an integer, got {type(value).__name__}"
 
         if value < min_val or value > max_val:
             return False, f"{field_name} must be between {min_val} and {max_val}, got {value}"
 
-        return True, None
+        return _OK
+
+    @staticmethod
+    def validate_integer_range_batch(values, min_val: int, max_val: int, field_name: str = 'values') -> Tuple[bool, Optional[str]]:
+        """
+        Validate every integer in a list (or 1-D NumPy integer array) is within range
+
+        Args:
+            values: List of integers, or a 1-D NumPy integer array
+            min_val: Minimum value (inclusive)
+            max_val: Maximum value (inclusive)
+            field_name: Name of field for error messages
+
+        Returns:
+            Tuple of (is_valid, error_message) for the first offending item
+
+        Example:
+            >>> valid, error = ContextValidator.validate_integer_range_batch([1, 5, 10], 1, 10, 'timeouts')
+            >>> assert valid == True
+
+            >>> valid, error = ContextValidator.validate_integer_range_batch([1, 15], 1, 10, 'timeouts')
+            >>> assert valid == False
+            >>> assert 'timeouts[1]' in error
+        """
+        # NumPy arrays are compared in native code; numpy itself is never
+        # imported here, arrays are recognised by their dtype
+        dtype = getattr(values, 'dtype', None)
+        if dtype is not None and getattr(values, 'ndim', None) == 1:
+            if dtype.kind not in 'iu':
+                return False, f"{field_name} must contain integers, got {dtype}"
+
+            out_of_range = (values < min_val) | (values > max_val)
+            if not out_of_range.any():
+                return _OK
+            i = int(out_of_range.argmax())
+            return False, f"{field_name}[{i}] must be between {min_val} and {max_val}, got {values[i]}"
+
+        if type(values) is not list and not isinstance(values, (list, tuple)):
+            return False, f"{field_name} must be a list"
+
+        # Plain ints only: a C-level type scan plus min/max settles it
+        if set(map(type, values)).issubset((int,)):
+            if not values or (min(values) >= min_val and max(values) <= max_val):
+                return _OK
+
+        for i, value in enumerate(values):
+            valid, error = ContextValidator.validate_integer_range(value, min_val, max_val, f"{field_name}[{i}]")
+            if not valid:
+                return False, error
+
+        return _OK
 
     @staticmethod
     def validate_pattern(value: str, pattern: str, field_name: str = 'value') -> Tuple[bool, Optional[str]]:
@@ -262,17 +677,32 @@ class ContextValidator:
 
             >>> valid, error = ContextValidator.validate_pattern('abc@123', r'^[a-z0-9]+$', 'name')
             >>> assert valid == False
+
+            Bounded or literal-separated repeats are fine; ambiguous nesting is refused
+            unless re2 is installed:
+
+            >>> ContextValidator.validate_pattern('10.0.0.1', r'^(\\d{1,3}\\.){3}\\d{1,3}$')
+            (True, None)
+            >>> ContextValidator.validate_pattern('a.b@mail.example.com', r'^[\\w.+-]+@[\\w-]+(\\.[\\w-]+)+$')
+            (True, None)
+            >>> re2 is not None or ContextValidator.validate_pattern('aaaa!', r'^(a+)+$')[1].startswith('Invalid regex')
+            True
+            >>> re2 is not None or ContextValidator.validate_pattern('.a.b', r'^(\\.[\\w.]+)+$')[1].startswith('Invalid regex')
+            True
         """
-        if not isinstance(value, str):
+        if type(value) is not str and not isinstance(value, str):
             return False, f"{field_name} must be a string"
 
+        if len(value) > MAX_PATTERN_INPUT:
+            return False, f"{field_name} is too long to validate: {len(value)} > {MAX_PATTERN_INPUT} characters"
+
         try:
-            if not re.match(pattern, value):
+            if not _compile_pattern(pattern)(value):
                 return False, f"{field_name} format invalid: '{value}' doesn't match pattern {pattern}"
         except re.error as e:
             return False, f"Invalid regex pattern: {e}"
 
-        return True, None
+        return _OK
 
     @staticmethod
     def sanitize_filename(filename: str) -> Tuple[bool, Optional[str], Optional[str]]:
@@ -298,15 +728,18 @@ class ContextValidator:
         if not filename or not isinstance(filename, str):
             return False, "Filename must be a non-empty string", None
 
+        # One pass collects every separator and dangerous character present
+        found = _FILENAME_REJECT_SET.intersection(filename)
+
         # Security: Check for path traversal
-        if '..' in filename or '/' in filename or '\\' in filename:
+        if '..' in filename or '/' in found or '\\' in found:
             return False, "Filename cannot contain path separators or '..'", None
 
         # Security: Check for dangerous characters
-        dangerous_chars = ['<', '>', ':', '"', '|', '?', '*', '\x00']
-        for char in dangerous_chars:
-            if char in filename:
-                return False, f"Filename contains forbidden character: {char}", None
+        if found:
+            for char in _FORBIDDEN_FILENAME_CHARS:
+                if char in found:
+                    return False, f"Filename contains forbidden character: {char}", None
 
         # Sanitize: Remove leading/trailing whitespace and dots
         sanitized = filename.strip().lstrip('.')
@@ -342,17 +775,17 @@ class ContextValidator:
             >>> assert valid == False
         """
         if not isinstance(context, dict):
-            return False, "Context must be a dictionary"
+            return _CONTEXT_NOT_DICT
 
         if not isinstance(required_fields, list):
             return False, "Required fields must be a list"
 
-        missing = [field for field in required_fields if field not in context]
-
-        if missing:
-            return False, f"Missing required field(s): {', '.join(missing)}"
+        # Success path: C-level membership tests, stopping at the first miss
+        if all(map(context.__contains__, required_fields)):
+            return _OK
 
-        return True, None
+        missing = [field for field in required_fields if field not in context]
+        return False, f"Missing required field(s): {', '.join(missing)}"
 
 
 class SkillContextValidator:
@@ -384,22 +817,26 @@ class SkillContextValidator:
             >>> assert valid == True
         """
         # Check context is a dictionary
-        if not isinstance(context, dict):
-            return False, "Context must be a dictionary"
+        if type(context) is not dict and not isinstance(context, dict):
+            return _CONTEXT_NOT_DICT
 
-        # Validate operation field
-        if 'operation' not in context:
+        # Validate operation field (validate_operation inlined; this runs
+        # on every skill invocation)
+        operation = context.get('operation')
+        if operation is None and 'operation' not in context:
             return False, "Missing required field: 'operation'"
 
-        valid, error = ContextValidator.validate_operation(
-            context['operation'],
-            allowed_operations
-        )
+        if not operation or (type(operation) is not str and not isinstance(operation, str)):
+            return _OPERATION_NOT_STRING
+
+        if not allowed_operations or (type(allowed_operations) is not list
+                                      and not isinstance(allowed_operations, (list, set, frozenset))):
+            return _OPERATIONS_REQUIRED
 
-        if not valid:
-            return False, error
+        if operation not in _lookup_allowed(allowed_operations):
+            return False, f"Invalid operation: '{operation}'. Allowed: {_allowed_text(allowed_operations)}"
 
-        return True, None
+        return _OK
 
 
 # Convenience function for Skills to get JSON error response
@@ -420,6 +857,6 @@ def validation_error_response(error_message: str) -> Dict:
     """
     return {
         "success": False,
-        "error": f"Validation error: {error_message}",
-        "error_type": "VALIDATION_ERROR"
+        "error": f"{_ERROR_PREFIX}{error_message}",
+        "error_type": _ERROR_TYPE
     }
@@ -4,19 +4,338 @@ Container Validator Skill - Main Entry Point
 Validates Dockerfiles, Kubernetes manifests, and container configurations
 """
 
+import hashlib
+import io
 import json
+import pickle
 import sys
 import os
 import re
-import yaml
+import tempfile
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
-from datetime import datetime
+from typing import Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; json is used when it is missing
+    orjson = None
+
+# PyYAML is imported on first use by _load_yaml, so Dockerfile-only runs skip it
+yaml = None
+YamlLoader = None
+
+# Below this many manifests a process pool costs more to start than it saves
+PROCESS_POOL_MIN_FILES = 4
+# Manifests read but not yet parsed, bounding how much sits in memory
+READ_AHEAD = 32
+
+SEVERITIES = ('critical', 'high', 'medium', 'low')
+K8S_ISSUE_FIELDS = ('file', 'severity', 'type', 'description', 'recommendation')
+K8S_ISSUE_LIMIT = 50
+
+def _parse_cache_dir():
+    """Parse cache location, or None when disabled or no home directory resolves"""
+    if os.environ.get('CONTAINER_VALIDATOR_NO_CACHE'):
+        return None
+    base = os.environ.get('XDG_CACHE_HOME', '')
+    if not os.path.isabs(base):
+        # expanduser returns '~' unchanged without HOME or a passwd entry
+        home = os.path.expanduser('~')
+        if not os.path.isabs(home):
+            return None
+        base = os.path.join(home, '.cache')
+    return os.path.join(base, 'container-validator')
+
+# Parsed manifests keyed by a hash of their bytes, so unchanged trees skip YAML parsing
+PARSE_CACHE_DIR = _parse_cache_dir()
+PARSE_CACHE_MAX_ENTRIES = 4096
+# Larger manifests (e.g. rendered Helm charts) are streamed doc by doc instead
+PARSE_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+# Per-file issue columns keyed by (path, st_dev, st_ino, st_mtime_ns, st_size),
+# so a long-lived process re-validates only manifests that changed
+RESULT_CACHE = OrderedDict()
+RESULT_CACHE_SIZE = 4096
+
+# Only these kinds have checks; other single-document manifests are
+# recognised from their first lines without a full parse
+K8S_CHECKED_KINDS = frozenset(('Deployment', 'Service'))
+K8S_HEADER_LINES = 32
+
+# All Dockerfile line checks in one pass: each optional lookahead captures
+# when its check hits, and the trailing conditionals drop lines where none did
+# (the scan already runs inside the regex engine; a JIT-compiled classifier
+# would take longer to import than thousands of Dockerfiles take to check)
+# Matched against the raw bytes, so the file is never decoded
+DOCKERFILE_PATTERN = re.compile(
+    rb'^'
+    rb'(?:(?=[^\S\n]*(USER))|)'
+    rb'(?:(?=[^\S\n]*(HEALTHCHECK))|)'
+    rb'(?:(?=(?=.*ENV)(.*(?:PASSWORD|SECRET|KEY|TOKEN)))|)'
+    rb'(?:(?=(?!.*rm -rf /var/lib/apt/lists)(.*apt-get install))|)'
+    rb'(?(1)|(?(2)|(?(3)|(?(4)|(?!)))))',
+    re.IGNORECASE | re.MULTILINE
+)
+
+def _load_yaml():
+    """Import PyYAML, preferring the libyaml loader"""
+    global yaml, YamlLoader
+    if yaml is not None:
+        return
+
+    import yaml as module
+    # libyaml bindings parse manifests roughly an order of magnitude faster
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as loader
+        print("Warning: libyaml not available, using the pure-Python YAML loader", file=sys.stderr)
+    yaml, YamlLoader = module, loader
+
+def _iter_yaml(root: str):
+    """Yield YAML file paths under root, each directory's files before its subdirectories"""
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:  # unreadable or not a directory, skipped like rglob does
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.endswith(('.yaml', '.yml')) and entry.is_file():
+                    yield entry.path
+        stack.extend(reversed(subdirs))
+
+def _read_manifest(yaml_file: str):
+    """Read a manifest's bytes, leaving read errors for the parse step to report"""
+    try:
+        with open(yaml_file, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def _parsed_docs(yaml_file: str, data: bytes):
+    """Yield a manifest's documents, reusing an earlier parse of the same bytes"""
+    cacheable = PARSE_CACHE_DIR is not None and len(data) <= PARSE_CACHE_MAX_BYTES
+    cached = None
+
+    if cacheable:
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        cache_file = os.path.join(PARSE_CACHE_DIR, digest + '.pkl')
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            os.utime(cache_file)
+        except Exception:  # missing or unreadable entry, parse afresh
+            cached = None
+
+    if cached is not None:
+        yield from cached
+        return
+
+    # Docs are only held on to when they will be written to the cache
+    docs = [] if cacheable else None
+    # Named so parse errors still point at the manifest
+    with io.BytesIO(data) as f:
+        f.name = yaml_file
+        for doc in yaml.load_all(f, Loader=YamlLoader):
+            if docs is not None:
+                docs.append(doc)
+            yield doc
+
+    if docs is None:
+        return
+
+    # Only complete parses are stored; the rename keeps concurrent readers off partial files
+    try:
+        os.makedirs(PARSE_CACHE_DIR, mode=0o700, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=PARSE_CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(docs, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except (OSError, pickle.PicklingError, RecursionError):  # deeply nested docs exceed pickle's recursion limit
+        pass
+
+def _prune_parse_cache():
+    """Drop the least recently used parse cache entries beyond PARSE_CACHE_MAX_ENTRIES"""
+    if PARSE_CACHE_DIR is None:
+        return
+    try:
+        with os.scandir(PARSE_CACHE_DIR) as it:
+            entries = [(e.stat().st_mtime_ns, e.path) for e in it if e.name.endswith('.pkl')]
+        if len(entries) > PARSE_CACHE_MAX_ENTRIES:
+            entries.sort()
+            for _, path in entries[:len(entries) - PARSE_CACHE_MAX_ENTRIES]:
+                os.remove(path)
+    except OSError:
+        pass
+
+def _unchecked_kind(data: bytes) -> bool:
+    """Whether a manifest is a single document whose kind has no checks"""
+    if b'\n---' in data:
+        return False
+
+    try:
+        header = yaml.load(b''.join(islice(io.BytesIO(data), K8S_HEADER_LINES)), Loader=YamlLoader)
+    except yaml.YAMLError:  # cut mid-structure, let the full parse decide
+        return False
+
+    return isinstance(header, dict) and isinstance(header.get('kind'), str) and header['kind'] not in K8S_CHECKED_KINDS
+
+def _validate_k8s_file(yaml_file: str, data: bytes = None) -> Tuple[List[str], ...]:
+    """Validate a single Kubernetes YAML file
+
+    Issues come back as (severities, types, descriptions, recommendations)
+    columns; dicts are only built for the issues that get reported.
+    """
+    severities, types, descriptions, recommendations = columns = ([], [], [], [])
+    _load_yaml()
+
+    def add(severity, issue_type, description, recommendation):
+        severities.append(severity)
+        types.append(issue_type)
+        descriptions.append(description)
+        recommendations.append(recommendation)
+
+    try:
+        if data is None:
+            with open(yaml_file, 'rb') as f:
+                data = f.read()
+
+        if _unchecked_kind(data):
+            return columns
+
+        for doc in _parsed_docs(yaml_file, data):
+            if not doc:
+                continue
+
+            kind = doc.get('kind', '')
+
+            if kind == 'Deployment':
+                # Check for resource limits
+                containers = doc.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
+
+                for container in containers:
+                    if 'resources' not in container:
+                        add('high', 'missing_resources',
+                            f"Container '{container.get('name')}' missing resource limits",
+                            'Add resources.limits.memory and resources.limits.cpu')
+
+                    if 'livenessProbe' not in container:
+                        add('medium', 'missing_probe',
+                            f"Container '{container.get('name')}' missing livenessProbe",
+                            'Add livenessProbe to container spec')
+
+                    # Check for privileged mode
+                    security_context = container.get('securityContext', {})
+                    if security_context.get('privileged', False):
+                        add('critical', 'privileged_container',
+                            'Container runs in privileged mode',
+                            'Remove privileged: true or use specific capabilities')
+
+            elif kind == 'Service':
+                # Check for exposed services
+                service_type = doc.get('spec', {}).get('type', 'ClusterIP')
+                if service_type == 'LoadBalancer':
+                    add('medium', 'exposed_service',
+                        'Service exposed via LoadBalancer',
+                        'Ensure proper security controls are in place')
+
+    except Exception as e:
+        add('high', 'parse_error',
+            f"Failed to parse YAML: {str(e)}",
+            'Fix YAML syntax errors')
+
+    return columns
+
+def _validate_k8s_files_pipelined(files: List[str]) -> List[Tuple[List[str], ...]]:
+    """Read manifests on I/O threads while worker processes parse them"""
+    results = []
+    reads = deque()
+    parses = deque()
+    workers = min(os.cpu_count() or 1, len(files))
+
+    def submit_parse():
+        path, read = reads.popleft()
+        parses.append(parsers.submit(_validate_k8s_file, path, read.result()))
+        # Bytes handed to the pool stay queued until parsed, so wait on the
+        # oldest parse rather than letting the whole tree pile up in memory
+        if len(parses) >= READ_AHEAD:
+            results.append(parses.popleft().result())
+
+    # Under the fork start method the first submit forks every worker at once;
+    # do it before any reader thread exists so no child inherits a running thread
+    with ProcessPoolExecutor(max_workers=workers) as parsers:
+        parsers.submit(int).result()
+        with ThreadPoolExecutor(max_workers=4) as readers:
+            for yaml_file in files:
+                reads.append((yaml_file, readers.submit(_read_manifest, yaml_file)))
+                if len(reads) >= READ_AHEAD:
+                    submit_parse()
+            while reads:
+                submit_parse()
+
+        # Collected in submission order so output matches the directory walk
+        results.extend(future.result() for future in parses)
+        return results
+
+def _stat_key(yaml_file: str):
+    """RESULT_CACHE key for a manifest, or None if it cannot be stat'ed"""
+    try:
+        st = os.stat(yaml_file)
+    except OSError:
+        return None
+    return (yaml_file, st.st_dev, st.st_ino, st.st_mtime_ns, st.st_size)
+
+def _validate_k8s_files(files: List[str]) -> List[Tuple[List[str], ...]]:
+    """Validate manifests, reusing results for files unchanged since an earlier call"""
+    keys = [_stat_key(yaml_file) for yaml_file in files]
+    results = []
+    misses = []
+
+    for key in keys:
+        cached = RESULT_CACHE.get(key) if key else None
+        if cached is None:
+            misses.append(len(results))
+        else:
+            RESULT_CACHE.move_to_end(key)
+        results.append(cached)
+
+    # Each manifest is independent, so fan the parse out across cores
+    stale = [files[i] for i in misses]
+    if len(stale) >= PROCESS_POOL_MIN_FILES:
+        fresh = _validate_k8s_files_pipelined(stale)
+    elif stale:
+        with ThreadPoolExecutor(max_workers=len(stale)) as ex:
+            fresh = list(ex.map(_validate_k8s_file, stale))
+    else:
+        fresh = []
+
+    for i, columns in zip(misses, fresh):
+        results[i] = columns
+        # Parse errors may be transient read failures, so they are not kept
+        if keys[i] and 'parse_error' not in columns[1]:
+            RESULT_CACHE[keys[i]] = columns
+    while len(RESULT_CACHE) > RESULT_CACHE_SIZE:
+        RESULT_CACHE.popitem(last=False)
+
+    return results
 
 class ContainerValidatorSkill:
     def __init__(self, context: Dict):
         self.context = context
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic_ns()
 
     def validate_dockerfile(self) -> Dict:
         """Validate Dockerfile"""
@@ -27,68 +346,77 @@ class ContainerValidatorSkill:
 
         issues = []
 
-        with open(dockerfile, 'r') as f:
-            lines = f.readlines()
-            has_user = False
-            has_healthcheck = False
-
-            for i, line in enumerate(lines):
-                line_upper = line.upper().strip()
-
-                # Check for USER directive
-                if line_upper.startswith('USER'):
-                    has_user = True
-
-                # Check for HEALTHCHECK
-                if line_upper.startswith('HEALTHCHECK'):
-                    has_healthcheck = True
-
-                # Check for EXPOSE with secrets
-                if 'ENV' in line_upper and any(s in line.upper() for s in ['PASSWORD', 'SECRET', 'KEY', 'TOKEN']):
-                    issues.append({
-                        'line': i + 1,
-                        'severity': 'high',
-                        'type': 'exposed_secret',
-                        'description': 'Potential secret in environment variable',
-                        'recommendation': 'Use Docker secrets or build arguments'
-                    })
-
-                # Check for apt-get without cleanup
-                if 'apt-get install' in line.lower() and 'rm -rf /var/lib/apt/lists' not in line.lower():
-                    issues.append({
-                        'line': i + 1,
-                        'severity': 'medium',
-                        'type': 'no_cleanup',
-                        'description': 'apt-get install without cleanup',
-                        'recommendation': 'Add: && rm -rf /var/lib/apt/lists/*'
-                    })
-
-            # Check if USER was set
-            if not has_user:
+        with open(dockerfile, 'rb') as f:
+            content = f.read()
+        # Same line splitting as text mode's universal newlines
+        if b'\r' in content:
+            content = content.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+        line_count = content.count(b'\n')
+        if content and not content.endswith(b'\n'):
+            line_count += 1
+
+        has_user = False
+        has_healthcheck = False
+        lineno = 1
+        last = 0
+
+        for m in DOCKERFILE_PATTERN.finditer(content):
+            start = m.start()
+            lineno += content.count(b'\n', last, start)
+            last = start
+            user, healthcheck, secret, apt_install = m.groups()
+
+            # Check for USER directive
+            if user:
+                has_user = True
+
+            # Check for HEALTHCHECK
+            if healthcheck:
+                has_healthcheck = True
+
+            # Check for EXPOSE with secrets
+            if secret is not None:
                 issues.append({
-                    'line': len(lines),
-                    'severity': 'critical',
-                    'type': 'root_user',
-                    'description': 'Container runs as root user',
-                    'recommendation': 'Add: USER nonroot'
+                    'line': lineno,
+                    'severity': 'high',
+                    'type': 'exposed_secret',
+                    'description': 'Potential secret in environment variable',
+                    'recommendation': 'Use Docker secrets or build arguments'
                 })
 
-            # Check for HEALTHCHECK
-            if not has_healthcheck:
+            # Check for apt-get without cleanup
+            if apt_install is not None:
                 issues.append({
-                    'line': len(lines),
+                    'line': lineno,
                     'severity': 'medium',
-                    'type': 'no_healthcheck',
-                    'description': 'Missing HEALTHCHECK instruction',
-                    'recommendation': 'Add: HEALTHCHECK CMD curl -f http://localhost/ || exit 1'
+                    'type': 'no_cleanup',
+                    'description': 'apt-get install without cleanup',
+                    'recommendation': 'Add: && rm -rf /var/lib/apt/lists/*'
                 })
 
-        by_severity = {
-            'critical': sum(1 for i in issues if i['severity'] == 'critical'),
-            'high': sum(1 for i in issues if i['severity'] == 'high'),
-            'medium': sum(1 for i in issues if i['severity'] == 'medium'),
-            'low': sum(1 for i in issues if i['severity'] == 'low')
-        }
+        # Check if USER was set
+        if not has_user:
+            issues.append({
+                'line': line_count,
+                'severity': 'critical',
+                'type': 'root_user',
+                'description': 'Container runs as root user',
+                'recommendation': 'Add: USER nonroot'
+            })
+
+        # Check for HEALTHCHECK
+        if not has_healthcheck:
+            issues.append({
+                'line': line_count,
+                'severity': 'medium',
+                'type': 'no_healthcheck',
+                'description': 'Missing HEALTHCHECK instruction',
+                'recommendation': 'Add: HEALTHCHECK CMD curl -f http://localhost/ || exit 1'
+            })
+
+        counts = Counter(issue['severity'] for issue in issues)
+        by_severity = {severity: counts[severity] for severity in SEVERITIES}
 
         return {
             'success': True,
@@ -107,102 +435,38 @@ class ContainerValidatorSkill:
         if not os.path.exists(k8s_dir):
             return {'success': False, 'error': f"Directory not found: {k8s_dir}"}
 
-        all_issues = []
-        files_validated = 0
+        # Loaded up front so forked workers inherit the import
+        _load_yaml()
 
-        for yaml_file in Path(k8s_dir).rglob('*.yaml'):
-            files_validated += 1
-            issues = self._validate_k8s_file(yaml_file)
-            all_issues.extend(issues)
+        # Path() only normalises the root so reported paths keep their old form
+        files = list(_iter_yaml(str(Path(k8s_dir))))
+        files_validated = len(files)
 
-        by_severity = {
-            'critical': sum(1 for i in all_issues if i['severity'] == 'critical'),
-            'high': sum(1 for i in all_issues if i['severity'] == 'high'),
-            'medium': sum(1 for i in all_issues if i['severity'] == 'medium'),
-            'low': sum(1 for i in all_issues if i['severity'] == 'low')
-        }
+        results = _validate_k8s_files(files)
+        _prune_parse_cache()
+
+        # Stream the per-file columns: every severity is counted, but only the
+        # reported slice is turned into dicts
+        counts = Counter()
+        issues = []
+        for yaml_file, columns in zip(files, results):
+            counts.update(columns[0])
+            room = K8S_ISSUE_LIMIT - len(issues)
+            if room > 0:
+                issues.extend(dict(zip(K8S_ISSUE_FIELDS, (yaml_file,) + row)) for row in islice(zip(*columns), room))
+
+        by_severity = {severity: counts[severity] for severity in SEVERITIES}
 
         return {
             'success': True,
             'operation': 'validate-k8s',
             'files_validated': files_validated,
-            'issues_found': len(all_issues),
+            'issues_found': sum(counts.values()),
             'by_severity': by_severity,
-            'issues': all_issues[:50],  # Limit output
+            'issues': issues,  # Limit output
             'execution_time_ms': self._get_execution_time()
         }
 
-    def _validate_k8s_file(self, yaml_file: Path) -> List[Dict]:
-        """Validate a single Kubernetes YAML file"""
-        issues = []
-
-        try:
-            with open(yaml_file, 'r') as f:
-                docs = yaml.safe_load_all(f)
-
-                for doc in docs:
-                    if not doc:
-                        continue
-
-                    kind = doc.get('kind', '')
-
-                    if kind == 'Deployment':
-                        # Check for resource limits
-                        containers = doc.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
-
-                        for container in containers:
-                            if 'resources' not in container:
-                                issues.append({
-                                    'file': str(yaml_file),
-                                    'severity': 'high',
-                                    'type': 'missing_resources',
-                                    'description': f"Container '{container.get('name')}' missing resource limits",
-                                    'recommendation': 'Add resources.limits.memory and resources.limits.cpu'
-                                })
-
-                            if 'livenessProbe' not in container:
-                                issues.append({
-                                    'file': str(yaml_file),
-                                    'severity': 'medium',
-                                    'type': 'missing_probe',
-                                    'description': f"Container '{container.get('name')}' missing livenessProbe",
-                                    'recommendation': 'Add livenessProbe to container spec'
-                                })
-
-                            # Check for privileged mode
-                            security_context = container.get('securityContext', {})
-                            if security_context.get('privileged', False):
-                                issues.append({
-                                    'file': str(yaml_file),
-                                    'severity': 'critical',
-                                    'type': 'privileged_container',
-                                    'description': 'Container runs in privileged mode',
-                                    'recommendation': 'Remove privileged: true or use specific capabilities'
-                                })
-
-                    elif kind == 'Service':
-                        # Check for exposed services
-                        service_type = doc.get('spec', {}).get('type', 'ClusterIP')
-                        if service_type == 'LoadBalancer':
-                            issues.append({
-                                'file': str(yaml_file),
-                                'severity': 'medium',
-                                'type': 'exposed_service',
-                                'description': 'Service exposed via LoadBalancer',
-                                'recommendation': 'Ensure proper security controls are in place'
-                            })
-
-        except Exception as e:
-            issues.append({
-                'file': str(yaml_file),
-                'severity': 'high',
-                'type': 'parse_error',
-                'description': f"Failed to parse YAML: {str(e)}",
-                'recommendation': 'Fix YAML syntax errors'
-            })
-
-        return issues
-
     def validate_compose(self) -> Dict:
         """Validate docker-compose.yml"""
         compose_file = self.context.get('file', 'docker-compose.yml')
@@ -211,10 +475,12 @@ class ContainerValidatorSkill:
             return {'success': False, 'error': f"File not found: {compose_file}"}
 
         issues = []
+        _load_yaml()
 
-        with open(compose_file, 'r') as f:
+        # PyYAML decodes the raw bytes itself, in one pass
+        with open(compose_file, 'rb') as f:
             try:
-                compose = yaml.safe_load(f)
+                compose = yaml.load(f, Loader=YamlLoader)
                 services = compose.get('services', {})
 
                 for service_name, service_config in services.items():
@@ -294,11 +560,11 @@ class ContainerValidatorSkill:
             total_issues += results['compose']['issues_found']
 
         # Calculate severity breakdown
-        by_severity = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
+        counts = Counter()
         for result in results.values():
             if 'by_severity' in result:
-                for sev, count in result['by_severity'].items():
-                    by_severity[sev] += count
+                counts.update(result['by_severity'])
+        by_severity = {severity: counts[severity] for severity in SEVERITIES}
 
         return {
             'success': True,
@@ -316,7 +582,32 @@ class ContainerValidatorSkill:
 
     def _get_execution_time(self) -> int:
         """Calculate execution time in milliseconds"""
-        return int((datetime.now() - self.start_time).total_seconds() * 1000)
+        return (time.monotonic_ns() - self.start_time) // 1_000_000
+
+# Operation name -> skill method
+OPERATIONS = {
+    'validate-dockerfile': ContainerValidatorSkill.validate_dockerfile,
+    'validate-k8s': ContainerValidatorSkill.validate_k8s,
+    'validate-compose': ContainerValidatorSkill.validate_compose,
+    'validate-all': ContainerValidatorSkill.validate_all
+}
+
+# Command line flag -> context key
+CLI_OPTIONS = {
+    '--operation': 'operation',
+    '--file': 'file',
+    '--dir': 'dir'
+}
+
+def print_result(result: Dict) -> None:
+    """Print the result as indented JSON on stdout"""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(
+            result,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        ))
+    else:
+        print(json.dumps(result, indent=2))
 
 def main():
     """Main entry point"""
@@ -327,14 +618,9 @@ def main():
     args = sys.argv[1:]
     i = 0
     while i < len(args):
-        if args[i] == '--operation' and i + 1 < len(args):
-            context['operation'] = args[i + 1]
-            i += 2
-        elif args[i] == '--file' and i + 1 < len(args):
-            context['file'] = args[i + 1]
-            i += 2
-        elif args[i] == '--dir' and i + 1 < len(args):
-            context['dir'] = args[i + 1]
+        key = CLI_OPTIONS.get(args[i])
+        if key and i + 1 < len(args):
+            context[key] = args[i + 1]
             i += 2
         else:
             i += 1
@@ -343,24 +629,19 @@ def main():
     skill = ContainerValidatorSkill(context)
 
     try:
-        if operation == 'validate-dockerfile':
-            result = skill.validate_dockerfile()
-        elif operation == 'validate-k8s':
-            result = skill.validate_k8s()
-        elif operation == 'validate-compose':
-            result = skill.validate_compose()
-        elif operation == 'validate-all':
-            result = skill.validate_all()
-        else:
+        method = OPERATIONS.get(operation)
+        if method is None:
             result = {'success': False, 'error': f"Unknown operation: {operation}"}
+        else:
+            result = method(skill)
 
         result['operation'] = operation
-        print(json.dumps(result, indent=2))
+        print_result(result)
         sys.exit(0 if result.get('success', False) else 1)
 
     except Exception as e:
         result = {'success': False, 'operation': operation, 'error': str(e)}
-        print(json.dumps(result, indent=2))
+        print_result(result)
         sys.exit(1)
 
 if __name__ == '__main__':
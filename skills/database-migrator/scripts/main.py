@@ -7,14 +7,29 @@ Schema version control and migration management
 import json
 import sys
 import os
+import re
+import time
 from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; json is used when it is missing
+    orjson = None
+
+# Next version number, kept beside the migrations so numbering needs no directory scan
+VERSION_COUNTER_FILE = '.nextver'
+# Leading version number of a migration file name, e.g. 003_add_users.sql
+MIGRATION_VERSION = re.compile(r'([0-9]+)_')
+
+# Every marker the safety checks look for, found in one case-insensitive pass
+MIGRATION_MARKERS = re.compile(rb'DROP DATABASE|-- DOWN|BEGIN|COMMIT', re.IGNORECASE)
+
 class DatabaseMigratorSkill:
     def __init__(self, context: Dict):
         self.context = context
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic_ns()
         self.migrations_dir = context.get('migrations_dir', './migrations')
 
     def generate_migration(self) -> Dict:
@@ -25,8 +40,8 @@ class DatabaseMigratorSkill:
         os.makedirs(self.migrations_dir, exist_ok=True)
 
         # Get next version number
-        existing_migrations = list(Path(self.migrations_dir).glob('*.sql'))
-        version = str(len(existing_migrations) + 1).zfill(3)
+        next_version = self._next_version()
+        version = str(next_version).zfill(3)
 
         # Create migration file
         filename = f"{version}_{name}.sql"
@@ -48,8 +63,14 @@ CREATE TABLE IF NOT EXISTS example (
 -- DROP TABLE IF EXISTS example;
 """
 
-        with open(filepath, 'w') as f:
-            f.write(template)
+        # Exclusive create, so a concurrent run claiming the same file fails instead of overwriting
+        try:
+            with open(filepath, 'x') as f:
+                f.write(template)
+        except FileExistsError:
+            return {'success': False, 'error': f"Migration file already exists: {filepath}"}
+
+        self._save_next_version(next_version + 1)
 
         return {
             'success': True,
@@ -145,35 +166,42 @@ CREATE TABLE IF NOT EXISTS example (
 
         for migration in migrations:
             # Check for dangerous operations
-            with open(migration, 'r') as f:
+            with open(migration, 'rb') as f:
                 content = f.read()
 
-                # Check for DROP DATABASE
-                if 'DROP DATABASE' in content.upper():
-                    issues.append({
-                        'file': migration.name,
-                        'severity': 'critical',
-                        'issue': 'Contains DROP DATABASE',
-                        'recommendation': 'Remove DROP DATABASE command'
-                    })
-
-                # Check for missing DOWN migration
-                if '-- DOWN' not in content.upper():
-                    issues.append({
-                        'file': migration.name,
-                        'severity': 'medium',
-                        'issue': 'Missing rollback script',
-                        'recommendation': 'Add DOWN migration for rollback'
-                    })
-
-                # Check for transactions
-                if 'BEGIN' not in content.upper() and 'COMMIT' not in content.upper():
-                    issues.append({
-                        'file': migration.name,
-                        'severity': 'low',
-                        'issue': 'Not wrapped in transaction',
-                        'recommendation': 'Wrap in BEGIN/COMMIT for atomicity'
-                    })
+            markers = set()
+            for m in MIGRATION_MARKERS.finditer(content):
+                markers.add(m.group().upper())
+                # Stop once every check is decided
+                if b'DROP DATABASE' in markers and b'-- DOWN' in markers and (b'BEGIN' in markers or b'COMMIT' in markers):
+                    break
+
+            # Check for DROP DATABASE
+            if b'DROP DATABASE' in markers:
+                issues.append({
+                    'file': migration.name,
+                    'severity': 'critical',
+                    'issue': 'Contains DROP DATABASE',
+                    'recommendation': 'Remove DROP DATABASE command'
+                })
+
+            # Check for missing DOWN migration
+            if b'-- DOWN' not in markers:
+                issues.append({
+                    'file': migration.name,
+                    'severity': 'medium',
+                    'issue': 'Missing rollback script',
+                    'recommendation': 'Add DOWN migration for rollback'
+                })
+
+            # Check for transactions
+            if b'BEGIN' not in markers and b'COMMIT' not in markers:
+                issues.append({
+                    'file': migration.name,
+                    'severity': 'low',
+                    'issue': 'Not wrapped in transaction',
+                    'recommendation': 'Wrap in BEGIN/COMMIT for atomicity'
+                })
 
         return {
             'success': True,
@@ -205,12 +233,51 @@ CREATE TABLE IF NOT EXISTS example (
             'execution_time_ms': self._get_execution_time()
         }
 
+    def _next_version(self) -> int:
+        """Read the next migration version from the counter file"""
+        counter_file = os.path.join(self.migrations_dir, VERSION_COUNTER_FILE)
+
+        try:
+            # Migrations added since the counter was written (a pull, a merge,
+            # a copied file) leave the directory newer than the counter
+            if os.stat(self.migrations_dir).st_mtime_ns <= os.stat(counter_file).st_mtime_ns:
+                with open(counter_file, 'r') as f:
+                    return int(f.read())
+        except (OSError, ValueError):
+            pass
+
+        # No usable counter, number after the highest existing version
+        return self._highest_version() + 1
+
+    def _highest_version(self) -> int:
+        """Highest numeric NNN_ prefix among the migration files"""
+        highest = 0
+        for migration in self._get_all_migrations():
+            match = MIGRATION_VERSION.match(migration.name)
+            if match:
+                highest = max(highest, int(match.group(1)))
+        return highest
+
+    def _save_next_version(self, version: int) -> None:
+        """Record the next migration version in the counter file"""
+        counter_file = os.path.join(self.migrations_dir, VERSION_COUNTER_FILE)
+
+        # Replaced via a temp file so readers never see a partial write
+        tmp_file = f"{counter_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(str(version))
+        os.replace(tmp_file, counter_file)
+        # The rename touches the directory; bring the counter level with it
+        # so the next run still trusts it
+        os.utime(counter_file)
+
     def _get_all_migrations(self) -> List[Path]:
         """Get all migration files"""
         if not os.path.exists(self.migrations_dir):
             return []
 
-        return sorted(Path(self.migrations_dir).glob('*.sql'))
+        with os.scandir(self.migrations_dir) as entries:
+            return sorted(Path(entry.path) for entry in entries if entry.name.endswith('.sql'))
 
     def _get_applied_migrations(self) -> List[Path]:
         """Get applied migrations (simulated)"""
@@ -229,7 +296,34 @@ CREATE TABLE IF NOT EXISTS example (
 
     def _get_execution_time(self) -> int:
         """Calculate execution time in milliseconds"""
-        return int((datetime.now() - self.start_time).total_seconds() * 1000)
+        return (time.monotonic_ns() - self.start_time) // 1_000_000
+
+# Operation name -> skill method
+OPERATIONS = {
+    'generate-migration': DatabaseMigratorSkill.generate_migration,
+    'apply-migration': DatabaseMigratorSkill.apply_migration,
+    'rollback': DatabaseMigratorSkill.rollback,
+    'validate': DatabaseMigratorSkill.validate,
+    'status': DatabaseMigratorSkill.status
+}
+
+# Command line flag -> context key
+CLI_OPTIONS = {
+    '--operation': 'operation',
+    '--name': 'name',
+    '--db-url': 'db_url',
+    '--migrations-dir': 'migrations_dir'
+}
+
+def print_result(result: Dict) -> None:
+    """Print the result as indented JSON on stdout"""
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(
+            result,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        ))
+    else:
+        print(json.dumps(result, indent=2))
 
 def main():
     """Main entry point"""
@@ -240,17 +334,9 @@ def main():
     args = sys.argv[1:]
     i = 0
     while i < len(args):
-        if args[i] == '--operation' and i + 1 < len(args):
-            context['operation'] = args[i + 1]
-            i += 2
-        elif args[i] == '--name' and i + 1 < len(args):
-            context['name'] = args[i + 1]
-            i += 2
-        elif args[i] == '--db-url' and i + 1 < len(args):
-            context['db_url'] = args[i + 1]
-            i += 2
-        elif args[i] == '--migrations-dir' and i + 1 < len(args):
-            context['migrations_dir'] = args[i + 1]
+        key = CLI_OPTIONS.get(args[i])
+        if key and i + 1 < len(args):
+            context[key] = args[i + 1]
             i += 2
         else:
             i += 1
@@ -259,26 +345,19 @@ def main():
     skill = DatabaseMigratorSkill(context)
 
     try:
-        if operation == 'generate-migration':
-            result = skill.generate_migration()
-        elif operation == 'apply-migration':
-            result = skill.apply_migration()
-        elif operation == 'rollback':
-            result = skill.rollback()
-        elif operation == 'validate':
-            result = skill.validate()
-        elif operation == 'status':
-            result = skill.status()
-        else:
+        method = OPERATIONS.get(operation)
+        if method is None:
             result = {'success': False, 'error': f"Unknown operation: {operation}"}
+        else:
+            result = method(skill)
 
         result['operation'] = operation
-        print(json.dumps(result, indent=2))
+        print_result(result)
         sys.exit(0 if result.get('success', False) else 1)
 
     except Exception as e:
         result = {'success': False, 'operation': operation, 'error': str(e)}
-        print(json.dumps(result, indent=2))
+        print_result(result)
         sys.exit(1)
 
 if __name__ == '__main__':
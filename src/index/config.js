@@ -4,6 +4,8 @@ const { resolveBaseDir } = require('../utils/runtime-paths.js');
 
 const DEFAULT_MODEL = process.env.WORKFLOW_ENGINE_EMBED_MODEL || 'BAAI/bge-small-en-v1.5';
 const DEFAULT_EMBED_BATCH = Number(process.env.WORKFLOW_ENGINE_EMBED_BATCH || 8);
+const INDEX_QUANTIZATION = process.env.WORKFLOW_ENGINE_INDEX_QUANTIZATION || 'float32';
+const EMBED_BACKEND = process.env.WORKFLOW_ENGINE_EMBED_BACKEND || 'torch';
 const BASE_DIR = resolveBaseDir();
 const INDEX_ROOT = process.env.WORKFLOW_ENGINE_INDEX_ROOT
     ? path.resolve(process.env.WORKFLOW_ENGINE_INDEX_ROOT)
@@ -25,6 +27,8 @@ const DIRECTORIES = {
 module.exports = {
     DEFAULT_MODEL,
     DEFAULT_EMBED_BATCH,
+    INDEX_QUANTIZATION,
+    EMBED_BACKEND,
     PYTHON_EXECUTABLE,
     FEATURE_FLAGS,
     DIRECTORIES,
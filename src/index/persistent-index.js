@@ -1,7 +1,13 @@
 const fs = require('fs');
 const path = require('path');
 const crypto = require('crypto');
-const { DIRECTORIES, DEFAULT_MODEL, FEATURE_FLAGS } = require('./config.js');
+const {
+    DIRECTORIES,
+    DEFAULT_MODEL,
+    FEATURE_FLAGS,
+    INDEX_QUANTIZATION,
+    EMBED_BACKEND,
+} = require('./config.js');
 const { runPythonCommand } = require('./python-runner.js');
 
 function ensureDir(target) {
@@ -63,6 +69,7 @@ class PersistentVectorIndex {
         const payload = {
             indexPath: this.indexPath,
             model: this.model,
+            backend: EMBED_BACKEND,
             documents: documents.map(doc => ({
                 id: doc.id,
                 text: doc.text,
@@ -89,9 +96,11 @@ class PersistentVectorIndex {
         const payload = {
             indexPath: this.indexPath,
             model: this.model,
+            backend: EMBED_BACKEND,
             query,
             limit: options.limit || 8,
             minScore: options.minScore || 0,
+            quantization: options.quantization || INDEX_QUANTIZATION,
         };
 
         try {